@@ -1,6 +1,11 @@
 import os
-import json
-from PyQt6.QtWidgets import (QLineEdit, QMessageBox, QPushButton, QHBoxLayout, 
+import shlex
+import codecs
+try:
+    import orjson as _json  # Faster settings (de)serialization when available
+except ImportError:
+    import json as _json
+from PyQt6.QtWidgets import (QLineEdit, QPushButton, QHBoxLayout, 
                            QVBoxLayout, QLabel, QDoubleSpinBox, QCheckBox, 
                            QGroupBox, QFormLayout, QWidget)
 from PyQt6.QtCore import QProcess, QTimer, pyqtSignal, QObject, Qt
@@ -31,6 +36,13 @@ class CommandManager(QObject):
     command_output = pyqtSignal(str, bool)  # Signal for command output (text, is_error)
     command_finished = pyqtSignal(int)  # Signal when command completes (exit code)
     
+    # Prefix of the discrete angle argument shown in the preview and passed to goad
+    _PREVIEW_PREFIX = "--discrete="
+    
+    # Angle preview label styles for when discrete angles are enabled/disabled
+    _PREVIEW_STYLE_ON = "color: black; font-style: normal; font-size: 10px;"
+    _PREVIEW_STYLE_OFF = "color: gray; font-style: italic; font-size: 10px;"
+    
     def __init__(self, settings_file, parent=None):
         super().__init__(parent)
         self.settings_file = settings_file
@@ -45,22 +57,53 @@ class CommandManager(QObject):
         self.beta_value = 0.0
         self.gamma_value = 0.0
         
-        # Load settings
-        self.load_settings()
+        # Settings cache: parsed settings keyed by file mtime, plus the last
+        # serialized settings so that unchanged saves can skip the write
+        self._settings_cache = None
+        self._settings_mtime = None
+        self._last_serialized = None
+        
+        # Settings are loaded lazily, the first time they are needed
+        self._settings_loaded = False
+        self._settings_dir_ready = False
         
         # Process for running commands
         self.process = QProcess(self)
-        self.process.setProcessChannelMode(QProcess.ProcessChannelMode.MergedChannels)
-        self.process.readyReadStandardOutput.connect(self._handle_stdout)
-        self.process.readyReadStandardError.connect(self._handle_stderr)
+        # stderr is merged into stdout, so only stdout needs to be read; failures
+        # are reported from the exit code in _process_finished. For debugging,
+        # GOAD_FORWARD_IO sends the output straight to the terminal the app was
+        # started from, skipping the pipes and the log widget altogether
+        self.forward_io = bool(os.getenv('GOAD_FORWARD_IO'))
+        self.process.setProcessChannelMode(QProcess.ProcessChannelMode.ForwardedChannels if self.forward_io
+                                           else QProcess.ProcessChannelMode.MergedChannels)
+        self.process.readyReadStandardOutput.connect(self._schedule_stdout_read)
         self.process.finished.connect(self._process_finished)
         self.process.errorOccurred.connect(self._process_error)
         
+        # Timer to coalesce bursts of output into a single read and emit
+        self._stdout_timer = QTimer(self)
+        self._stdout_timer.setSingleShot(True)
+        self._stdout_timer.setInterval(20)
+        self._stdout_timer.timeout.connect(self._handle_stdout)
+        
+        # Safeguard timer to warn about processes that might be hanging
+        self._timeout_timer = QTimer(self)
+        self._timeout_timer.setSingleShot(True)
+        self._timeout_timer.timeout.connect(self._check_process_timeout)
+        
+        # Incremental decoder so multi-byte characters split across reads decode correctly
+        self._stdout_decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        
         self.input = None  # Will be set to QLineEdit when create_ui is called
         self.run_button = None  # Will be set to QPushButton when create_ui is called
+        self._last_preview_text = None  # Last text shown in the angle preview label
+        self._tokenized_cache = (None, [])  # (command text, tokens) of the last run
+        self._last_cmdline = (None, "")  # ((program, args), log line) of the last run
         
     def create_ui(self):
         """Create the UI components for command input and execution"""
+        self._ensure_settings_loaded()
+        
         # Create main command layout
         main_command_layout = QVBoxLayout()
         
@@ -126,9 +169,11 @@ class CommandManager(QObject):
         angle_layout.addLayout(form_layout)
         
         # Add a preview label
-        self.angle_preview = QLabel("--discrete 0.0,0.0,0.0")
-        self.angle_preview.setStyleSheet("color: gray; font-style: italic; font-size: 10px;")
+        self.angle_preview = QLabel(self._PREVIEW_PREFIX + "0.0,0.0,0.0")
+        self.angle_preview.setStyleSheet(
+            self._PREVIEW_STYLE_ON if self.use_discrete_angles else self._PREVIEW_STYLE_OFF)
         self.angle_preview.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self._last_preview_text = None  # New label, so the next update must set it
         angle_layout.addWidget(self.angle_preview)
         
         # Connect value changed signals
@@ -146,28 +191,10 @@ class CommandManager(QObject):
         # Add stretcher to fill vertical space
         angle_column.addStretch()
         
-        # === COLUMN 2: Empty for now ===
-        column2 = QVBoxLayout()
-        column2_group = QGroupBox("Column 2")
-        column2_layout = QVBoxLayout()
-        column2_layout.addWidget(QLabel("Reserved for future controls"))
-        column2_group.setLayout(column2_layout)
-        column2.addWidget(column2_group)
-        column2.addStretch()
-        
-        # === COLUMN 3: Empty for now ===
-        column3 = QVBoxLayout()
-        column3_group = QGroupBox("Column 3")
-        column3_layout = QVBoxLayout()
-        column3_layout.addWidget(QLabel("Reserved for future controls"))
-        column3_group.setLayout(column3_layout)
-        column3.addWidget(column3_group)
-        column3.addStretch()
-        
-        # Add the three columns to the horizontal layout
+        # Add the angle column to the horizontal layout; the remaining 2/3 of the
+        # space is reserved for future controls (add their columns here when needed)
         three_column_layout.addLayout(angle_column, 1)  # 1/3 of space
-        three_column_layout.addLayout(column2, 1)       # 1/3 of space
-        three_column_layout.addLayout(column3, 1)       # 1/3 of space
+        three_column_layout.addStretch(2)               # 2/3 of space
         
         # Add the three-column layout to the main layout
         main_command_layout.addLayout(three_column_layout)
@@ -214,18 +241,15 @@ class CommandManager(QObject):
         enabled = (state == Qt.CheckState.Checked.value)
         self.use_discrete_angles = enabled
         
-        self.alpha_input.setEnabled(enabled)
-        self.beta_input.setEnabled(enabled)
-        self.gamma_input.setEnabled(enabled)
-        self.angle_preview.setEnabled(enabled)
+        for widget in (self.alpha_input, self.beta_input, self.gamma_input, self.angle_preview):
+            widget.setEnabled(enabled)
         
         # Update the preview text color based on enabled state
+        self.angle_preview.setStyleSheet(self._PREVIEW_STYLE_ON if enabled else self._PREVIEW_STYLE_OFF)
+        
+        # The preview text only needs refreshing when the angles are in use
         if enabled:
-            self.angle_preview.setStyleSheet("color: black; font-style: normal;")
-        else:
-            self.angle_preview.setStyleSheet("color: gray; font-style: italic;")
-            
-        self._update_angle_preview()
+            self._update_angle_preview()
     
     def _update_angle_preview(self):
         """Update the angle preview label"""
@@ -238,12 +262,17 @@ class CommandManager(QObject):
         self.beta_value = beta
         self.gamma_value = gamma
         
-        # Updated format with quotes
-        preview_text = f'--discrete={alpha:.1f},{beta:.1f},{gamma:.1f}'
+        preview_text = self._PREVIEW_PREFIX + f"{alpha:.1f},{beta:.1f},{gamma:.1f}"
+        
+        # Skip the label update when the displayed (1 decimal) text is unchanged
+        if preview_text == self._last_preview_text:
+            return
+        self._last_preview_text = preview_text
         self.angle_preview.setText(preview_text)
     
     def reset_command(self):
         """Reset command to current default"""
+        self._ensure_settings_loaded()
         if self.input:
             self.input.setText(self.default_command)
             
@@ -269,12 +298,13 @@ class CommandManager(QObject):
     
     def save_as_default(self):
         """Save current command as new default"""
+        self._ensure_settings_loaded()
         if not self.input:
             return
             
         new_default = self.input.text()
         if not new_default:
-            QMessageBox.warning(None, "Input Error", "Please enter a command before saving as default.")
+            self.command_output.emit("Please enter a command before saving as default.", True)
             return
         
         self.default_command = new_default
@@ -283,6 +313,7 @@ class CommandManager(QObject):
         
     def factory_reset(self):
         """Reset to the factory default command"""
+        self._ensure_settings_loaded()
         self.default_command = self.factory_default_command
         if self.input:
             self.input.setText(self.default_command)
@@ -295,42 +326,33 @@ class CommandManager(QObject):
             return
             
         command_text = self.input.text()
-        if not command_text:
-            QMessageBox.warning(None, "Input Error", "Please enter a command.")
+        if not command_text.strip():
+            self.command_output.emit("Please enter a command.", True)
+            return
+        
+        # Split the command into program and arguments
+        try:
+            parts = self._split_command(command_text)
+        except ValueError as e:
+            self.command_output.emit(f"Invalid command: {str(e)}", True)
             return
         
         # Add discrete angles if enabled
         if self.use_discrete_angles:
-            alpha = self.alpha_input.value()
-            beta = self.beta_input.value()
-            gamma = self.gamma_input.value()
-            angle_arg = f'--discrete={alpha:.1f},{beta:.1f},{gamma:.1f}'  # Changed commas to spaces
+            # The preview label already holds the formatted argument, and using it
+            # guarantees the command matches what the user sees
+            angle_arg = self.angle_preview.text()
             
-            # Append to command text if not already present
-            if "--discrete" not in command_text:
-                command_text = f"{command_text} {angle_arg}"
+            # Replace an existing --discrete parameter, or append one if not present
+            index = next((i for i, part in enumerate(parts)
+                          if part == "--discrete" or part.startswith("--discrete=")), -1)
+            if index < 0:
+                parts = parts + [angle_arg]
             else:
-                # Replace existing --discrete parameter
-                parts = command_text.split()
-                new_parts = []
-                skip_next = False
-                
-                for i, part in enumerate(parts):
-                    if skip_next:
-                        skip_next = False
-                        continue
-                        
-                    if part == "--discrete" and i + 1 < len(parts):
-                        # Replace --discrete value format
-                        new_parts.append(f'--discrete="{parts[i + 1]}"')
-                        skip_next = True
-                    elif part.startswith("--discrete="):
-                        # Replace existing --discrete=value format with space-separated values
-                        new_parts.append(f'--discrete="{alpha:.1f},{beta:.1f},{gamma:.1f}"')
-                    else:
-                        new_parts.append(part)
-                        
-                command_text = " ".join(new_parts)
+                # "--discrete VALUE" spans two tokens, "--discrete=VALUE" just one
+                end = index + 2 if parts[index] == "--discrete" else index + 1
+                parts = parts[:index] + [angle_arg] + parts[end:]
+            command_text = " ".join(parts)
         
         # Disable run button during process execution
         if self.run_button:
@@ -339,35 +361,67 @@ class CommandManager(QObject):
         # Emit signal that command has started
         self.command_started.emit(command_text)
         
-        # Split the command into program and arguments
-        parts = command_text.split()
         program = parts[0]
-        args = parts[1:] if len(parts) > 1 else []
+        args = parts[1:]
         
         # Set up process properly
         self.process.setProgram(program)
         self.process.setArguments(args)
         
         # Start the process - properly separated now
-        self.command_output.emit(f"Executing: {program} with args: {' '.join(args)}\n", False)
+        self.command_output.emit(self._command_log_line(program, args), False)
+        if self.forward_io:
+            self.command_output.emit("Output is forwarded to the terminal (GOAD_FORWARD_IO is set)\n", False)
         self.process.start()
         
         # Set a timeout - add a safeguard to prevent infinite hanging
-        QTimer.singleShot(100000, self._check_process_timeout)
+        self._timeout_timer.start(100000)
+    
+    def _split_command(self, command_text):
+        """Split a command string into tokens, reusing the result for a repeated command"""
+        if self._tokenized_cache[0] != command_text:
+            # Only pay for shell-style parsing when the command uses quoting
+            if any(c in command_text for c in '"\'\\'):
+                tokens = shlex.split(command_text)
+            else:
+                tokens = command_text.split()
+            self._tokenized_cache = (command_text, tokens)
+        return list(self._tokenized_cache[1])
+    
+    def _command_log_line(self, program, args):
+        """Return the 'Executing' log line, reusing it when the same command is re-run"""
+        key = (program, tuple(args))
+        if self._last_cmdline[0] != key:
+            self._last_cmdline = (key, f"Executing: {program} with args: {' '.join(args)}\n")
+        return self._last_cmdline[1]
+    
+    def _ensure_settings_loaded(self):
+        """Load settings from disk if they haven't been loaded yet"""
+        if not self._settings_loaded:
+            self.load_settings()
     
     def load_settings(self):
         """Load application settings from JSON file"""
+        self._settings_loaded = True
         try:
-            if os.path.exists(self.settings_file):
-                with open(self.settings_file, 'r') as f:
-                    settings = json.load(f)
-                    self.default_command = settings.get('default_command', self.factory_default_command)
+            mtime = self._settings_file_mtime()
+            if mtime is not None:
+                # Only re-read and parse the file if it changed since the last load
+                if self._settings_cache is None or mtime != self._settings_mtime:
+                    with open(self.settings_file, 'rb') as f:
+                        serialized = f.read()
+                    self._settings_cache = _json.loads(serialized)
+                    self._settings_mtime = mtime
+                    self._last_serialized = serialized
                     
-                    # Load angle settings if present
-                    self.use_discrete_angles = settings.get('use_discrete_angles', False)
-                    self.alpha_value = settings.get('alpha_value', 0.0)
-                    self.beta_value = settings.get('beta_value', 0.0)
-                    self.gamma_value = settings.get('gamma_value', 0.0)
+                settings = self._settings_cache
+                self.default_command = settings.get('default_command', self.factory_default_command)
+                
+                # Load angle settings if present
+                self.use_discrete_angles = settings.get('use_discrete_angles', False)
+                self.alpha_value = settings.get('alpha_value', 0.0)
+                self.beta_value = settings.get('beta_value', 0.0)
+                self.gamma_value = settings.get('gamma_value', 0.0)
             else:
                 self.default_command = self.factory_default_command
         except Exception as e:
@@ -384,36 +438,75 @@ class CommandManager(QObject):
                 'beta_value': self.beta_value,
                 'gamma_value': self.gamma_value
             }
+            serialized = _json.dumps(settings)
+            if isinstance(serialized, str):  # stdlib json returns str, orjson bytes
+                serialized = serialized.encode('utf-8')
             
-            # Create directory if it doesn't exist
-            os.makedirs(os.path.dirname(self.settings_file), exist_ok=True)
+            # Skip the write if nothing changed and the file is as we left it
+            if (serialized == self._last_serialized
+                    and self._settings_file_mtime() == self._settings_mtime):
+                return True
             
-            with open(self.settings_file, 'w') as f:
-                json.dump(settings, f)
+            # Create directory if it doesn't exist (only checked on the first save)
+            if not self._settings_dir_ready:
+                os.makedirs(os.path.dirname(self.settings_file) or '.', exist_ok=True)
+                self._settings_dir_ready = True
+            
+            # Write to a temporary file and swap it in, so an interrupted write
+            # can never leave a truncated settings file behind
+            tmp_file = self.settings_file + '.tmp'
+            with open(tmp_file, 'wb') as f:
+                f.write(serialized)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.settings_file)
+            
+            # Remember what was written so the next load/save can use the cache
+            self._settings_cache = settings
+            self._settings_mtime = self._settings_file_mtime()
+            self._last_serialized = serialized
                 
             return True
         except Exception as e:
             self.command_output.emit(f"Error saving settings: {str(e)}", True)
             return False
     
+    def _settings_file_mtime(self):
+        """Return the settings file modification time, or None if it doesn't exist"""
+        try:
+            return os.stat(self.settings_file).st_mtime_ns
+        except FileNotFoundError:
+            return None
+    
     def _check_process_timeout(self):
         """Check if the process is still running after timeout"""
         if self.process.state() == QProcess.ProcessState.Running:
             self.command_output.emit("\nProcess seems to be taking too long. It might be hanging.", True)
             self.command_output.emit("You can terminate it by closing the app or running a new command.", True)
     
-    def _handle_stdout(self):
+    def _schedule_stdout_read(self):
+        """Defer reading standard output so many small writes are read at once"""
+        if not self._stdout_timer.isActive():
+            self._stdout_timer.start()
+    
+    def _handle_stdout(self, final=False):
         """Handle standard output data from the process"""
-        data = self.process.readAllStandardOutput().data().decode('utf-8', errors='replace')
-        self.command_output.emit(data, False)
-        
-    def _handle_stderr(self):
-        """Handle standard error data from the process"""
-        data = self.process.readAllStandardError().data().decode('utf-8', errors='replace')
-        self.command_output.emit(data, True)
+        # QByteArray exposes the buffer protocol, so it can be decoded without
+        # first copying it into a Python bytes object via .data()
+        data = self._stdout_decoder.decode(self.process.readAllStandardOutput(), final)
+        if final:
+            self._stdout_decoder.reset()
+        if data:
+            self.command_output.emit(data, False)
         
     def _process_finished(self, exit_code, exit_status):
         """Called when the process finishes"""
+        # Drain any output still buffered (or waiting on the coalescing timer)
+        # so it is shown before the completion message
+        self._stdout_timer.stop()
+        self._handle_stdout(final=True)
+        self._timeout_timer.stop()
+        
         if exit_code == 0:
             self.command_output.emit("\nCommand completed successfully.", False)
         else:
@@ -437,6 +530,8 @@ class CommandManager(QObject):
             QProcess.ProcessError.UnknownError: "Unknown error: An unknown error occurred."
         }
         
+        self._timeout_timer.stop()
+        
         error_message = error_messages.get(error, f"Process error: {error}")
         self.command_output.emit(error_message, True)
         
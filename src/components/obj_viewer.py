@@ -1,65 +1,208 @@
 import numpy as np
 from OpenGL.GL import *
-from OpenGL.GLU import *
 from PyQt6.QtOpenGLWidgets import QOpenGLWidget
-from PyQt6.QtCore import Qt, QPoint
+from PyQt6.QtCore import Qt, QPoint, QTimer
 from PyQt6.QtGui import QSurfaceFormat
 from PyQt6.QtWidgets import QVBoxLayout, QWidget, QLabel, QHBoxLayout
 import math
 import os
 
+def _parse_vectors(lines):
+    """Parse the x, y, z components of 'v'/'vn' line bodies into an (N, 3) float32 array"""
+    if not lines:
+        return np.empty((0, 3), dtype=np.float32)
+    
+    try:
+        values = np.fromstring(b' '.join(lines).decode('ascii'), sep=' ', dtype=np.float32)
+    except ValueError:
+        values = None  # A non-numeric token, such as a trailing comment
+    if values is None or values.size != 3 * len(lines):
+        # Some lines carry extra components (e.g. w or vertex colors) or comments,
+        # keep x, y, z only
+        values = np.array([line.split()[:3] for line in lines], dtype=np.float32)
+    return values.reshape(-1, 3)
+
+def _parse_face_corners(text, num_corners):
+    """Parse whitespace separated face corners into 0-based vertex and normal index arrays (-1 = no normal)"""
+    if num_corners == 0:
+        return np.empty(0, dtype=np.int32), np.empty(0, dtype=np.int32)
+    
+    num_slashes = text.count(b'/')
+    
+    if num_slashes == 0:  # v format
+        vidx = np.fromstring(text.decode('ascii'), sep=' ', dtype=np.int32)
+        if vidx.size == num_corners:
+            return vidx - 1, np.full(num_corners, -1, dtype=np.int32)
+    
+    elif num_slashes == num_corners:  # v/vt format, no normals
+        fields = np.fromstring(text.replace(b'/', b' ').decode('ascii'), sep=' ', dtype=np.int32)
+        if fields.size == 2 * num_corners:
+            return fields[0::2] - 1, np.full(num_corners, -1, dtype=np.int32)
+    
+    elif num_slashes == 2 * num_corners:  # v//vn or v/vt/vn format
+        # Give empty texture fields a placeholder so every corner has three numbers
+        numbers = text.replace(b'//', b'/0/').replace(b'/', b' ')
+        fields = np.fromstring(numbers.decode('ascii'), sep=' ', dtype=np.int32)
+        if fields.size == 3 * num_corners:
+            return fields[0::3] - 1, fields[2::3] - 1
+    
+    # Mixed or unusual formats: parse corner by corner
+    vidx = np.empty(num_corners, dtype=np.int32)
+    nidx = np.full(num_corners, -1, dtype=np.int32)
+    for i, token in enumerate(text.split()):
+        w = token.split(b'/')
+        vidx[i] = int(w[0]) - 1
+        if len(w) >= 3 and w[2]:
+            nidx[i] = int(w[2]) - 1
+    return vidx, nidx
+
+def _fan_triangles(face_sizes):
+    """Fan-triangulate faces given their corner counts
+    
+    Returns the (T, 3) indices into the flat list of all face corners, and the
+    face each triangle came from. A face with n corners gives n-2 triangles
+    (0, k+1, k+2) for k = 0..n-3.
+    """
+    tri_counts = np.maximum(face_sizes - 2, 0)
+    face_starts = np.cumsum(face_sizes) - face_sizes
+    tri_starts = np.cumsum(tri_counts) - tri_counts
+    
+    first = np.repeat(face_starts, tri_counts)
+    k = np.arange(tri_counts.sum()) - np.repeat(tri_starts, tri_counts)
+    corners = np.stack([first, first + k + 1, first + k + 2], axis=1)
+    tri_face = np.repeat(np.arange(len(face_sizes), dtype=np.int32), tri_counts)
+    return corners, tri_face
+
+def _scale_matrix(factor):
+    """4x4 uniform scale matrix"""
+    return np.diag([factor, factor, factor, 1.0])
+
+def _translation_matrix(offset):
+    """4x4 translation matrix"""
+    m = np.identity(4)
+    m[:3, 3] = offset
+    return m
+
+def _rotation_matrix(angle, axis):
+    """4x4 rotation by angle degrees about the x (0), y (1) or z (2) axis, as glRotatef"""
+    c = math.cos(math.radians(angle))
+    s = math.sin(math.radians(angle))
+    i, j = [(1, 2), (2, 0), (0, 1)][axis]
+    m = np.identity(4)
+    m[i, i] = m[j, j] = c
+    m[i, j] = -s
+    m[j, i] = s
+    return m
+
 class OBJModel:
-    """Class to parse and store OBJ model data"""
+    """Class to parse and store OBJ model data
+    
+    vertices and normals are (N, 3) float32 arrays; tri_vidx and tri_nidx hold
+    the (T, 3) vertex and normal indices of the triangulated faces, and
+    triangle_indices the (T, 3) indices of their corners in the face list.
+    All indices are validated at load: every vertex index is in range, and a
+    normal index is either in range or -1 for "no normal".
+    """
     
     def __init__(self, filename=None):
-        self.vertices = []
-        self.normals = []
-        self.faces = []
+        self._clear_arrays()
         if filename:
             self.load(filename)
     
     def load(self, filename):
         """Load an OBJ file"""
-        self.vertices = []
-        self.normals = []
-        self.faces = []
+        self._clear_arrays()
         
         try:
-            with open(filename, 'r') as f:
-                for line in f:
-                    if line.startswith('#'):  # Skip comments
-                        continue
-                    
-                    values = line.split()
-                    if not values:
-                        continue
-                    
-                    if values[0] == 'v':  # Vertices
-                        vertex = list(map(float, values[1:4]))
-                        self.vertices.append(vertex)
-                    
-                    elif values[0] == 'vn':  # Normals
-                        normal = list(map(float, values[1:4]))
-                        self.normals.append(normal)
-                    
-                    elif values[0] == 'f':  # Faces
-                        # OBJ faces can have different formats
-                        # Here we handle v//vn format (vertex and normal indices)
-                        face = []
-                        for v in values[1:]:
-                            w = v.split('/')
-                            if len(w) >= 3:  # v/vt/vn format
-                                face.append((int(w[0]) - 1, int(w[2]) - 1 if w[2] else -1))
-                            elif len(w) == 2:  # v//vn format
-                                face.append((int(w[0]) - 1, int(w[1]) - 1))
-                            else:  # v format
-                                face.append((int(w[0]) - 1, -1))
-                        self.faces.append(face)
+            # Read the whole file at once and pick out the lines by their prefix;
+            # the numbers themselves are converted in bulk by NumPy
+            with open(filename, 'rb') as f:
+                lines = [line.lstrip() for line in f.read().splitlines()]
+            
+            vertex_lines = [line[2:] for line in lines if line.startswith((b'v ', b'v\t'))]
+            normal_lines = [line[3:] for line in lines if line.startswith((b'vn ', b'vn\t'))]
+            face_lines = [line[2:] for line in lines if line.startswith((b'f ', b'f\t'))]
+            
+            self.vertices = _parse_vectors(vertex_lines)
+            self.normals = _parse_vectors(normal_lines)
+            
+            # OBJ faces can have different formats: v, v/vt, v//vn or v/vt/vn
+            self.face_sizes = np.array([len(line.split()) for line in face_lines], dtype=np.int32)
+            corner_vidx, corner_nidx = _parse_face_corners(b' '.join(face_lines), int(self.face_sizes.sum()))
             
+            self._triangulate(corner_vidx, corner_nidx)
+            self._build_draw_arrays()
             return True
         except Exception as e:
             print(f"Error loading OBJ file: {e}")
             return False
+    
+    def _clear_arrays(self):
+        """Reset the model data"""
+        self.vertices = np.empty((0, 3), dtype=np.float32)
+        self.normals = np.empty((0, 3), dtype=np.float32)
+        self.face_sizes = np.empty(0, dtype=np.int32)
+        self.tri_vidx = np.empty((0, 3), dtype=np.int32)
+        self.tri_nidx = np.empty((0, 3), dtype=np.int32)
+        self.tri_face = np.empty(0, dtype=np.int32)
+        self.triangle_indices = np.empty((0, 3), dtype=np.int64)
+        self.draw_positions = np.empty((0, 3), dtype=np.float32)
+        self.draw_normals = np.empty((0, 3), dtype=np.float32)
+        self.draw_indices = np.empty(0, dtype=np.uint32)
+    
+    def _triangulate(self, corner_vidx, corner_nidx):
+        """Fan-triangulate all faces at once into (T, 3) vertex and normal index arrays"""
+        num_faces = len(self.face_sizes)
+        if num_faces and self.face_sizes.min() == 3 and self.face_sizes.max() == 3:
+            # All triangles (the usual exporter output): the corners already are the triangles
+            corners = np.arange(3 * num_faces).reshape(-1, 3)
+            tri_face = np.arange(num_faces, dtype=np.int32)
+        else:
+            corners, tri_face = _fan_triangles(self.face_sizes)
+        
+        tri_vidx = corner_vidx[corners]
+        tri_nidx = corner_nidx[corners]
+        
+        # Drop triangles that reference vertices that don't exist
+        valid = np.all((tri_vidx >= 0) & (tri_vidx < len(self.vertices)), axis=1)
+        self.triangle_indices = corners[valid]
+        self.tri_vidx = tri_vidx[valid]
+        self.tri_face = tri_face[valid]
+        
+        # Normals that don't exist are treated as missing
+        tri_nidx = tri_nidx[valid]
+        self.tri_nidx = np.where((tri_nidx >= 0) & (tri_nidx < len(self.normals)), tri_nidx, -1)
+    
+    def _build_draw_arrays(self):
+        """Build indexed arrays ready for upload to the GPU, one entry per unique corner"""
+        if len(self.tri_vidx) == 0:
+            return
+        
+        num_faces = len(self.face_sizes)
+        num_normals = len(self.normals)
+        
+        # Corners without a valid normal are flat shaded with their face's normal
+        # (area-weighted sum of its triangle normals, which also handles non-planar faces)
+        p0, p1, p2 = (self.vertices[self.tri_vidx[:, i]] for i in range(3))
+        face_normals = np.zeros((num_faces, 3), dtype=np.float32)
+        np.add.at(face_normals, self.tri_face, np.cross(p1 - p0, p2 - p0))
+        lengths = np.linalg.norm(face_normals, axis=1, keepdims=True)
+        face_normals = np.where(lengths > 0, face_normals / np.maximum(lengths, 1e-30),
+                                np.float32([0.0, 0.0, 1.0]))
+        
+        # Normal table: the file's normals followed by the face normals, and the
+        # normal index of each corner into that table
+        normal_table = np.vstack([self.normals, face_normals.astype(np.float32)])
+        nidx = np.where(self.tri_nidx >= 0, self.tri_nidx, num_normals + self.tri_face[:, None])
+        
+        # A (vertex, normal) pair only needs to be stored once and can be shared
+        # by every triangle that uses it
+        keys = self.tri_vidx.astype(np.int64).ravel() * (num_normals + num_faces) + nidx.ravel()
+        unique_keys, inverse = np.unique(keys, return_inverse=True)
+        
+        self.draw_positions = self.vertices[unique_keys // (num_normals + num_faces)]
+        self.draw_normals = normal_table[unique_keys % (num_normals + num_faces)]
+        self.draw_indices = inverse.astype(np.uint32).ravel()
 
 class OBJViewer(QOpenGLWidget):
     """OpenGL Widget for rendering OBJ files"""
@@ -85,7 +228,8 @@ class OBJViewer(QOpenGLWidget):
         self.last_pos = QPoint()
         
         # Colors for the model
-        self.model_color = (0.7, 0.7, 0.9, 1.0)  # Light blue
+        # Kept as a float32 array so glMaterialfv can pass it to GL without conversion
+        self.model_color = np.array([0.7, 0.7, 0.9, 1.0], dtype=np.float32)  # Light blue
         self.background_color = (0.2, 0.2, 0.2, 1.0)  # Dark gray
         
         # Set minimum size to ensure visibility
@@ -94,40 +238,77 @@ class OBJViewer(QOpenGLWidget):
         # Allow mouse tracking for interactivity
         self.setMouseTracking(True)
         
+        # Coalesce redraws from mouse drags and wheel events to about one per frame
+        self._redraw_timer = QTimer(self)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.setInterval(1000 // 60)
+        self._redraw_timer.timeout.connect(self.update)
+        
         # Initialize model center and size with defaults
         self.model_center = np.array([0.0, 0.0, 0.0])
         self.model_size = 1.0
+        
+        # GPU buffers (positions, normals, indices) for the model, uploaded on
+        # the next paint after a model is loaded
+        self._buffers = None
+        self._buffers_dirty = False
+        self._index_count = 0
+        self._axes_list = None
+        
+        # Modelview matrices for the axes and the model, rebuilt only when the
+        # view parameters they depend on change
+        self._view_key = None
+        self._axes_matrix = None
+        self._model_matrix = None
     
     def load_obj(self, filename):
         """Load an OBJ file and prepare it for rendering"""
         if os.path.exists(filename):
-            success = self.obj_model.load(filename)
-            if success:
-                # Calculate bounds to center the model
-                if self.obj_model.vertices:
-                    min_bounds = np.min(np.array(self.obj_model.vertices), axis=0)
-                    max_bounds = np.max(np.array(self.obj_model.vertices), axis=0)
-                    
-                    # Center the model and scale it to fit the view
-                    self.model_center = (min_bounds + max_bounds) / 2
-                    self.model_size = np.max(max_bounds - min_bounds)
-                    
-                    self.update()  # Trigger a redraw
-                    return True, f"Loaded OBJ model with {len(self.obj_model.vertices)} vertices and {len(self.obj_model.faces)} faces"
+            model = OBJModel()
+            if model.load(filename):
+                self.obj_model = model
+                if self.refresh():
+                    return True, f"Loaded OBJ model with {len(model.vertices)} vertices and {len(model.face_sizes)} faces"
             
             return False, "Failed to load OBJ file"
         else:
             return False, f"File not found: {filename}"
     
+    def refresh(self):
+        """Recompute the view bounds for the current model and schedule a redraw"""
+        if not len(self.obj_model.vertices):
+            return False
+        
+        # Vertices are already a float32 array, so reduce it in place
+        vertices = self.obj_model.vertices
+        min_bounds = vertices.min(axis=0)
+        max_bounds = vertices.max(axis=0)
+        
+        # Center the model and scale it to fit the view
+        self.model_center = (min_bounds + max_bounds) / 2
+        self.model_size = float((max_bounds - min_bounds).max())
+        
+        self._buffers_dirty = True  # Upload the new geometry on the next paint
+        self.update()  # Trigger a redraw
+        return True
+    
     def initializeGL(self):
         """Initialize OpenGL settings"""
         glClearColor(*self.background_color)
         glEnable(GL_DEPTH_TEST)
         glEnable(GL_LIGHTING)
         glEnable(GL_LIGHT0)
-        glLightfv(GL_LIGHT0, GL_POSITION, [1.0, 1.0, 1.0, 0.0])
-        glLightfv(GL_LIGHT0, GL_AMBIENT, [0.2, 0.2, 0.2, 1.0])
-        glLightfv(GL_LIGHT0, GL_DIFFUSE, [0.8, 0.8, 0.8, 1.0])
+        glEnable(GL_NORMALIZE)  # Model scaling in paintGL also scales the normals
+        glLightfv(GL_LIGHT0, GL_POSITION, np.array([1.0, 1.0, 1.0, 0.0], dtype=np.float32))
+        glLightfv(GL_LIGHT0, GL_AMBIENT, np.array([0.2, 0.2, 0.2, 1.0], dtype=np.float32))
+        glLightfv(GL_LIGHT0, GL_DIFFUSE, np.array([0.8, 0.8, 0.8, 1.0], dtype=np.float32))
+        
+        # Buffers from a previous context are gone, so upload the model again
+        self._buffers = None
+        self._buffers_dirty = True
+        
+        # The axes never change, so record them once per context
+        self._compile_axes()
     
     def resizeGL(self, width, height):
         """Handle widget resize events with orthographic projection"""
@@ -154,73 +335,102 @@ class OBJViewer(QOpenGLWidget):
     def paintGL(self):
         """Render the scene with orthographic projection"""
         glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
-        glLoadIdentity()
-        
-        # For orthographic projection, use scaling instead of z-translation for zoom
-        scale_factor = self.zoom
-        glScalef(scale_factor, scale_factor, scale_factor)
-        
-        # Apply rotations
-        glRotatef(self.rotation_y, 0.0, 1.0, 0.0)  # Y-axis rotation (yaw)
-        glRotatef(self.rotation_x, 1.0, 0.0, 0.0)  # X-axis rotation (pitch)
-        glRotatef(self.rotation_z, 0.0, 0.0, 1.0)  # Z-axis rotation (roll)
+        self._update_view_matrices()
         
         # Draw coordinate axes first
-        self._draw_axes()
+        glLoadMatrixf(self._axes_matrix)
+        glCallList(self._axes_list)
         
         # If we have a model, center and scale it
-        if self.obj_model.vertices:
-            # Scale to fit view
-            model_scale = 2.0 / self.model_size if self.model_size > 0 else 1.0
-            glScalef(model_scale, model_scale, model_scale)
-            
-            # Center the model
-            glTranslatef(-self.model_center[0], -self.model_center[1], -self.model_center[2])
+        if len(self.obj_model.vertices):
+            glLoadMatrixf(self._model_matrix)
             
             # Set material properties and render model as before
             glMaterialfv(GL_FRONT_AND_BACK, GL_AMBIENT_AND_DIFFUSE, self.model_color)
             
             # Draw the model
-            glBegin(GL_TRIANGLES)
-            for face in self.obj_model.faces:
-                for i in range(min(3, len(face))):  # Ensure we only use the first 3 vertices (triangulate)
-                    vi, ni = face[i]
-                    
-                    # Apply normal if available
-                    if ni >= 0 and ni < len(self.obj_model.normals):
-                        glNormal3fv(self.obj_model.normals[ni])
-                    
-                    # Apply vertex
-                    if vi >= 0 and vi < len(self.obj_model.vertices):
-                        glVertex3fv(self.obj_model.vertices[vi])
-                        
-                # If face has more than 3 vertices, triangulate
-                for i in range(3, len(face)):
-                    # First vertex
-                    vi, ni = face[0]
-                    if ni >= 0:
-                        glNormal3fv(self.obj_model.normals[ni])
-                    glVertex3fv(self.obj_model.vertices[vi])
-                    
-                    # Previous vertex
-                    vi, ni = face[i-1]
-                    if ni >= 0:
-                        glNormal3fv(self.obj_model.normals[ni])
-                    glVertex3fv(self.obj_model.vertices[vi])
-                    
-                    # Current vertex
-                    vi, ni = face[i]
-                    if ni >= 0:
-                        glNormal3fv(self.obj_model.normals[ni])
-                    glVertex3fv(self.obj_model.vertices[vi])
-            glEnd()
+            if self._buffers_dirty:
+                self._upload_buffers()
+            self._draw_buffers()
+    
+    def _update_view_matrices(self):
+        """Rebuild the cached axes and model matrices if the view has changed"""
+        key = (self.zoom, self.rotation_x, self.rotation_y, self.rotation_z,
+               self.model_size, tuple(self.model_center))
+        if key == self._view_key:
+            return
+        self._view_key = key
+        
+        # For orthographic projection, use scaling instead of z-translation for zoom,
+        # then yaw (Y), pitch (X) and roll (Z) in the order glRotatef applied them
+        axes = (_scale_matrix(self.zoom)
+                @ _rotation_matrix(self.rotation_y, 1)
+                @ _rotation_matrix(self.rotation_x, 0)
+                @ _rotation_matrix(self.rotation_z, 2))
+        
+        # Scale the model to fit the view and center it
+        model_scale = 2.0 / self.model_size if self.model_size > 0 else 1.0
+        model = axes @ _scale_matrix(model_scale) @ _translation_matrix(-np.asarray(self.model_center))
+        
+        # OpenGL expects column-major order, i.e. the transpose of the NumPy layout
+        self._axes_matrix = np.ascontiguousarray(axes.T, dtype=np.float32)
+        self._model_matrix = np.ascontiguousarray(model.T, dtype=np.float32)
+    
+    def _upload_buffers(self):
+        """Upload the model's triangle arrays into GPU buffers"""
+        self._delete_buffers()
+        self._buffers_dirty = False
+        
+        model = self.obj_model
+        if len(model.draw_indices) == 0:
+            return
+        
+        self._buffers = glGenBuffers(3)
+        glBindBuffer(GL_ARRAY_BUFFER, self._buffers[0])
+        glBufferData(GL_ARRAY_BUFFER, model.draw_positions.nbytes, model.draw_positions, GL_STATIC_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, self._buffers[1])
+        glBufferData(GL_ARRAY_BUFFER, model.draw_normals.nbytes, model.draw_normals, GL_STATIC_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self._buffers[2])
+        glBufferData(GL_ELEMENT_ARRAY_BUFFER, model.draw_indices.nbytes, model.draw_indices, GL_STATIC_DRAW)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+        self._index_count = len(model.draw_indices)
     
-    def _draw_axes(self):
-        """Draw the coordinate axes (X: blue, Y: green, Z: red)"""
-        # Save current lighting state
-        lighting_enabled = glIsEnabled(GL_LIGHTING)
+    def _delete_buffers(self):
+        """Free the GPU buffers of the previously loaded model"""
+        if self._buffers is not None:
+            glDeleteBuffers(3, self._buffers)
+            self._buffers = None
+            self._index_count = 0
+    
+    def _draw_buffers(self):
+        """Draw the uploaded model with a single indexed draw call"""
+        if self._buffers is None:
+            return
+        
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_NORMAL_ARRAY)
+        
+        glBindBuffer(GL_ARRAY_BUFFER, self._buffers[0])
+        glVertexPointer(3, GL_FLOAT, 0, None)
+        glBindBuffer(GL_ARRAY_BUFFER, self._buffers[1])
+        glNormalPointer(GL_FLOAT, 0, None)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self._buffers[2])
+        
+        glDrawElements(GL_TRIANGLES, self._index_count, GL_UNSIGNED_INT, None)
+        
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        glDisableClientState(GL_NORMAL_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+    
+    def _compile_axes(self):
+        """Record the coordinate axes (X: red, Y: green, Z: blue) into a display list"""
+        self._axes_list = glGenLists(1)
+        glNewList(self._axes_list, GL_COMPILE)
         
-        # Disable lighting for the axes
+        # Disable lighting for the axes (lighting is always on for the model)
         glDisable(GL_LIGHTING)
         
         # Set line properties
@@ -229,25 +439,16 @@ class OBJViewer(QOpenGLWidget):
         # Draw coordinate axes at origin
         axis_length = 1.0  # Length of each axis
         
-        # X axis - Red
         glBegin(GL_LINES)
-        glColor3f(1.0, 0.0, 0.0)  # Red
-        glVertex3f(0.0, 0.0, 0.0)  # Origin
-        glVertex3f(axis_length, 0.0, 0.0)  # X direction
-        glEnd()
-        
-        # Y axis - Green
-        glBegin(GL_LINES)
-        glColor3f(0.0, 1.0, 0.0)  # Green
-        glVertex3f(0.0, 0.0, 0.0)  # Origin
-        glVertex3f(0.0, axis_length, 0.0)  # Y direction
-        glEnd()
-        
-        # Z axis - Blue
-        glBegin(GL_LINES)
-        glColor3f(0.0, 0.0, 1.0)  # Blue
-        glVertex3f(0.0, 0.0, 0.0)  # Origin
-        glVertex3f(0.0, 0.0, axis_length)  # Z direction
+        glColor3f(1.0, 0.0, 0.0)  # X axis - Red
+        glVertex3f(0.0, 0.0, 0.0)
+        glVertex3f(axis_length, 0.0, 0.0)
+        glColor3f(0.0, 1.0, 0.0)  # Y axis - Green
+        glVertex3f(0.0, 0.0, 0.0)
+        glVertex3f(0.0, axis_length, 0.0)
+        glColor3f(0.0, 0.0, 1.0)  # Z axis - Blue
+        glVertex3f(0.0, 0.0, 0.0)
+        glVertex3f(0.0, 0.0, axis_length)
         glEnd()
         
         # Add small labels at the end of each axis
@@ -255,13 +456,12 @@ class OBJViewer(QOpenGLWidget):
         self._draw_axis_label("Y", 0.0, axis_length, 0.0, (0.0, 1.0, 0.0))
         self._draw_axis_label("Z", 0.0, 0.0, axis_length, (1.0, 0.0, 0.0))
         
-        # Reset color to white
+        # Reset color to white and restore lighting
         glColor3f(1.0, 1.0, 1.0)
+        glEnable(GL_LIGHTING)
         
-        # Restore lighting state
-        if lighting_enabled:
-            glEnable(GL_LIGHTING)
-
+        glEndList()
+    
     def _draw_axis_label(self, text, x, y, z, color):
         """Draw a text label at the specified position (simplified)"""
         # Note: Text rendering in OpenGL requires more setup
@@ -288,7 +488,7 @@ class OBJViewer(QOpenGLWidget):
             self.rotation_y += dx * 0.5
             self.rotation_x += dy * 0.5
             
-            self.update()
+            self._schedule_update()
         
         self.last_pos = pos
     
@@ -308,7 +508,12 @@ class OBJViewer(QOpenGLWidget):
         # Ensure minimum and maximum zoom levels
         self.zoom = max(0.1, min(self.zoom, 10.0))
         
-        self.update()
+        self._schedule_update()
+    
+    def _schedule_update(self):
+        """Defer the redraw so bursts of input events repaint at most once per frame"""
+        if not self._redraw_timer.isActive():
+            self._redraw_timer.start()
 
 class MultiViewOBJViewer(QWidget):
     """Container widget that manages multiple OBJ viewers with different perspectives"""
@@ -362,17 +567,19 @@ class MultiViewOBJViewer(QWidget):
     def load_obj(self, filename):
         """Load OBJ model in both viewers"""
         try:
-            # Load the model in both viewers
-            success1, message1 = self.top_viewer.load_obj(filename)
-            success2, message2 = self.bottom_viewer.load_obj(filename)
+            if not os.path.exists(filename):
+                return False, f"File not found: {filename}"
+            
+            # Parse the file once and hand the same model to both viewers
+            model = OBJModel()
+            if not model.load(filename) or not len(model.vertices):
+                return False, "Error loading model: Failed to load OBJ file"
             
-            if success1 and success2:
-                self.current_model_file = filename
-                return True, f"Model loaded successfully in both views"
-            elif success1:
-                return False, f"Error loading in second view: {message2}"
-            else:
-                return False, f"Error loading model: {message1}"
+            self.top_viewer.obj_model = self.bottom_viewer.obj_model = model
+            self.top_viewer.refresh()
+            self.bottom_viewer.refresh()
+            self.current_model_file = filename
+            return True, f"Model loaded successfully in both views"
         except Exception as e:
             import traceback
             return False, f"Exception loading model: {str(e)}\n{traceback.format_exc()}"
\ No newline at end of file
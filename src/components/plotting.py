@@ -1,11 +1,93 @@
 import numpy as np
-import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 from PyQt6.QtWidgets import QWidget, QVBoxLayout
 import os
+import math
 import toml
 
+def _bin_accumulate_kernel(angles, values, centers, step, half_width):
+    """Single pass sum and count of values into evenly spaced bins centred on centers"""
+    nbins = centers.size
+    sums = np.zeros(nbins)
+    counts = np.zeros(nbins, np.int64)
+    for i in range(angles.size):
+        a = angles[i]
+        if a != a:  # NaN angles never fall in a bin
+            continue
+        # Only the bins around the angle's grid position can contain it
+        first = max(int(math.floor((a - half_width - centers[0]) / step)), 0)
+        last = min(int(math.floor((a + half_width - centers[0]) / step)) + 1, nbins - 1)
+        for j in range(first, last + 1):
+            if centers[j] - half_width <= a < centers[j] + half_width:
+                sums[j] += values[i]
+                counts[j] += 1
+    return sums, counts
+
+_bin_accumulate = None
+_bin_accumulate_loaded = False
+
+# Below this many points sorting is far cheaper than importing and compiling numba
+_BIN_KERNEL_MIN_POINTS = 1_000_000
+
+def _get_bin_accumulate():
+    """Return the numba-compiled binning kernel, or None if numba isn't installed
+    
+    numba is optional and slow to import, so it is only loaded the first time
+    large unsorted data needs binning. The compiled kernel isn't cached on disk:
+    numba's cache records the module name, which differs between the app
+    (components.plotting) and the tests (src.components.plotting).
+    """
+    global _bin_accumulate, _bin_accumulate_loaded
+    if not _bin_accumulate_loaded:
+        _bin_accumulate_loaded = True
+        try:
+            from numba import njit
+        except ImportError:
+            return None
+        _bin_accumulate = njit(_bin_accumulate_kernel)
+    return _bin_accumulate
+
+def _bin_means(angles, values, centers, width):
+    """Average values into bins of the given width centred on each angle in centers.
+    
+    Returns the per-bin means (0 for empty bins) and the number of points in each bin.
+    """
+    global _bin_accumulate
+    half_width = width / 2
+    if not np.all(angles[1:] >= angles[:-1]):
+        step = (centers[-1] - centers[0]) / (len(centers) - 1) if len(centers) > 1 else 1.0
+        bin_accumulate = None
+        if angles.size >= _BIN_KERNEL_MIN_POINTS and step > 0 and np.allclose(np.diff(centers), step):
+            bin_accumulate = _get_bin_accumulate()
+        if bin_accumulate is not None:
+            # Large, unsorted, evenly spaced bins: accumulate in one pass instead of sorting
+            try:
+                sums, counts = bin_accumulate(np.ascontiguousarray(angles, dtype=np.float64),
+                                              np.ascontiguousarray(values, dtype=np.float64),
+                                              np.ascontiguousarray(centers, dtype=np.float64),
+                                              step, half_width)
+                return np.where(counts > 0, sums / np.maximum(counts, 1), 0.0), counts
+            except Exception as e:
+                # Don't retry (and recompile) on every plot; sort from now on
+                _bin_accumulate = None
+                print(f"Binning kernel failed, falling back to sorting: {e}")
+        
+        order = np.argsort(angles, kind='stable')
+        angles = angles[order]
+        values = values[order]
+    
+    # Each bin covers [center - width/2, center + width/2) of the sorted angles
+    lo = np.searchsorted(angles, centers - half_width, side='left')
+    hi = np.searchsorted(angles, centers + half_width, side='left')
+    counts = hi - lo
+    
+    # Sum every [lo, hi) slice in one pass; the trailing zero keeps hi == len(values) in range
+    padded = np.append(values, 0.0)
+    sums = np.add.reduceat(padded, np.column_stack((lo, hi)).ravel())[::2]
+    means = np.where(counts > 0, sums / np.maximum(counts, 1), 0.0)
+    return means, counts
+
 class PlottingWidget(QWidget):
     """Widget for plotting light scattering data"""
     
@@ -14,8 +96,7 @@ class PlottingWidget(QWidget):
         self.setMinimumHeight(300)
         
         # Default constants from phips_goad.py
-        self.wavelength = 0.532  # Default wavelength in microns
-        self.waveno = 2 * np.pi / self.wavelength
+        self.wavelength = 0.532  # Default wavelength in microns (also sets waveno)
         
         # Default settings for PHIPS bins
         self.num_detectors = 20
@@ -25,12 +106,23 @@ class PlottingWidget(QWidget):
         
         # Reference data file
         self.reference_data_file = "Plate_Crystal_IMPACTS2022_RF02_3606.txt"
+        self._ref_cache = {}  # path -> (mtime_ns, data)
+        self._bins_cache = {}  # path -> (mtime_ns, bins or None)
+        self._mueller_cache = (None, None)  # (path, mtime_ns, size, usecols) -> data
         
         # Setup the figure canvas
         self.figure = Figure(figsize=(5, 4), dpi=100)
         self.canvas = FigureCanvas(self.figure)
         self.axes = self.figure.add_subplot(111)
         
+        # The GOAD line is drawn separately from the static parts of the plot
+        # (axes, grid, legend, reference data) so replots can blit just the line
+        self._goad_line = None
+        self._background = None
+        self._plot_state = None  # Reference file state the static plot was drawn for
+        self._reference_log = ""
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+        
         # Setup layout
         layout = QVBoxLayout()
         layout.addWidget(self.canvas)
@@ -39,29 +131,102 @@ class PlottingWidget(QWidget):
         # Clear the plot initially
         self.clear_plot()
     
+    @property
+    def wavelength(self):
+        return self._wavelength
+    
+    @wavelength.setter
+    def wavelength(self, value):
+        # Keep the wavenumber and DSCS conversion factor in step with the wavelength
+        self._wavelength = value
+        self.waveno = 2 * np.pi / value
+        self._dscs_factor = 1e-12 / self.waveno**2
+    
     def clear_plot(self):
         """Clear the plot"""
+        self._goad_line = None
+        self._background = None
+        self._plot_state = None
         self.axes.clear()
         self.axes.set_title("No data loaded")
         self.axes.set_xlabel("Scattering Angle (degrees)")
         self.axes.set_ylabel("Mean DSCS")
         self.canvas.draw()
     
-    def read_mueller_scatgrid(self, filename='goad_run/mueller_scatgrid'):
-        """Read the mueller_scatgrid file and return as numpy array"""
-        if not os.path.exists(filename):
+    def _on_draw(self, event):
+        """Capture the static background after a full draw, then draw the GOAD line over it"""
+        # Saving draws the figure through another canvas; save_plot includes the line itself
+        if event.canvas is not self.canvas or self.canvas.is_saving() or self._goad_line is None:
+            return
+        self._background = self.canvas.copy_from_bbox(self.axes.bbox)
+        self._goad_line.draw(event.renderer)
+    
+    def _can_blit(self, state, theta, values):
+        """Check whether new GOAD values can be drawn over the cached background"""
+        if self._background is None or state != self._plot_state:
+            return False
+        if not np.array_equal(self._goad_line.get_xdata(), theta):
+            return False
+        
+        # The y limits stay fixed, so fall back to a full redraw if the values don't fit
+        positive = values[values > 0]
+        ymin, ymax = self.axes.get_ylim()
+        return positive.size == 0 or (ymin <= positive.min() and positive.max() <= ymax)
+    
+    def read_mueller_scatgrid(self, filename='goad_run/mueller_scatgrid', usecols=None):
+        """Read the mueller_scatgrid file and return as numpy array
+        
+        usecols selects the columns to read (all by default), as for np.loadtxt.
+        The parsed array is reused until the file changes; it is read-only.
+        """
+        try:
+            st = os.stat(filename)
+        except OSError:
             return None, f"Error: Mueller scatgrid file {filename} not found"
+        
+        key = (filename, st.st_mtime_ns, st.st_size, usecols)
+        if key == self._mueller_cache[0]:
+            data = self._mueller_cache[1]
+            return data, f"Successfully loaded {filename} with shape {data.shape}"
             
         try:
-            data = np.loadtxt(filename)
+            data = np.loadtxt(filename, usecols=usecols, ndmin=2)
+            data.flags.writeable = False
+            self._mueller_cache = (key, data)
             return data, f"Successfully loaded {filename} with shape {data.shape}"
         except Exception as e:
             return None, f"Error reading {filename}: {str(e)}"
     
+    def _load_reference_data(self, filename):
+        """Load reference data, reusing the parsed array while the file is unchanged"""
+        mtime = os.stat(filename).st_mtime_ns
+        cached = self._ref_cache.get(filename)
+        if cached is None or cached[0] != mtime:
+            # Load reference data with tab separator, skipping comment lines
+            cached = (mtime, np.loadtxt(filename, comments='//'))
+            self._ref_cache[filename] = cached
+        return cached[1]
+    
+    def _load_bins(self, filename):
+        """Load the 'bins' array from a TOML file, reusing it while the file is unchanged
+        
+        Returns None if the file has no 'bins' key.
+        """
+        mtime = os.stat(filename).st_mtime_ns
+        cached = self._bins_cache.get(filename)
+        if cached is None or cached[0] != mtime:
+            with open(filename, 'r') as f:
+                bins_data = toml.load(f)
+            bins = np.asarray(bins_data['bins'], dtype=float) if 'bins' in bins_data else None
+            cached = (mtime, bins)
+            self._bins_cache[filename] = cached
+        return cached[1]
+    
     def process_and_plot_data(self, data_file, bins_file=None):
         """Process and plot the mueller scatgrid data with reference data if available"""
         # If bins_file is provided, use it, otherwise use default PHIPS binning
-        data, message = self.read_mueller_scatgrid(data_file)
+        # Only the angle (0) and S11 (2) columns are plotted, so skip parsing the rest
+        data, message = self.read_mueller_scatgrid(data_file, usecols=(0, 2))
         
         if data is None:
             self.clear_plot()
@@ -69,50 +234,49 @@ class PlottingWidget(QWidget):
         
         try:
             # Process data here...
-            # Divide the third column of the data by the dscs conversion factor
-            processed_data = data.copy()
-            processed_data[:, 2] *= 1e-12 / self.waveno**2
+            # Scale the S11 column by the dscs conversion factor
+            angles = data[:, 0]
+            dscs = data[:, 1] * self._dscs_factor
             
             # If we have a bins file, use those bins
             if bins_file and os.path.exists(bins_file):
-                with open(bins_file, 'r') as f:
-                    bins_data = toml.load(f)
-                    
-                if 'bins' not in bins_data:
+                phips_bins = self._load_bins(bins_file)
+                if phips_bins is None:
                     return False, f"Error: No 'bins' key in {bins_file}"
                     
-                phips_bins = np.array(bins_data['bins'])
                 # Additional custom binning code would go here
             
             # Create default binning based on PHIPS settings
             theta = np.linspace(self.phips_start, self.phips_end, self.num_detectors)
-            values = np.zeros_like(theta)
+            values, counts = _bin_means(angles, dscs, theta, self.bin_width)
             
-            # For each bin, find data points within this angular range and average them
-            bin_values_log = []
-            for i in range(len(theta)):
-                half_width = self.bin_width / 2
-                indices = np.where((processed_data[:, 0] >= theta[i]-half_width) & 
-                                 (processed_data[:, 0] < theta[i]+half_width))
-                
-                if len(indices[0]) > 0:
-                    values[i] = np.mean(processed_data[indices, 2])
-                    bin_values_log.append(f"Bin {i}: theta={theta[i]:.1f}°, {len(indices[0])} points, mean S11={values[i]:.6e}")
-                else:
-                    bin_values_log.append(f"Bin {i}: theta={theta[i]:.1f}°, no data points found")
+            bin_values_log = [f"Bin {i}: theta={t:.1f}°, {n} points, mean S11={v:.6e}" if n > 0
+                              else f"Bin {i}: theta={t:.1f}°, no data points found"
+                              for i, (t, n, v) in enumerate(zip(theta, counts, values))]
+            
+            # Only the GOAD line changed: redraw it over the cached background
+            reference_file = self.reference_data_file
+            state = (reference_file, os.stat(reference_file).st_mtime_ns if os.path.exists(reference_file) else None)
+            if self._can_blit(state, theta, values):
+                self._goad_line.set_ydata(values)
+                self.canvas.restore_region(self._background)
+                self.axes.draw_artist(self._goad_line)
+                self.canvas.blit(self.axes.bbox)
+                bin_values_log.append(self._reference_log)
+                return True, "\n".join(bin_values_log)
             
             # Generate the plot
             self.axes.clear()
             
-            # Plot the computed data in blue
-            self.axes.plot(theta, values, 'o-', markersize=8, color='b', label='GOAD')
+            # Plot the computed data in blue; it is animated so full draws leave it
+            # out of the cached background and _on_draw adds it on top
+            self._goad_line, = self.axes.plot(theta, values, 'o-', markersize=8, color='b',
+                                              label='GOAD', animated=True)
             
             # Replace the reference file section in process_and_plot_data
-            reference_file = self.reference_data_file
             if os.path.exists(reference_file):
                 try:
-                    # Load reference data with tab separator, skipping comment lines
-                    ref_data = np.loadtxt(reference_file, comments='//')
+                    ref_data = self._load_reference_data(reference_file)
                     
                     # Extract angles and values
                     ref_angles = ref_data[:, 0]
@@ -122,11 +286,12 @@ class PlottingWidget(QWidget):
                     self.axes.plot(ref_angles, ref_values, 's-', markersize=6, color='r', 
                                   label='PHIPS (IMPACTS2022)')
                     
-                    bin_values_log.append("\nReference data from IMPACTS2022 also plotted")
+                    self._reference_log = "\nReference data from IMPACTS2022 also plotted"
                 except Exception as e:
-                    bin_values_log.append(f"\nError loading reference data: {str(e)}")
+                    self._reference_log = f"\nError loading reference data: {str(e)}"
             else:
-                bin_values_log.append(f"\nReference data file '{reference_file}' not found")
+                self._reference_log = f"\nReference data file '{reference_file}' not found"
+            bin_values_log.append(self._reference_log)
             
             # Complete the plot formatting
             self.axes.set_xlabel('Scattering Angle (degrees)')
@@ -136,6 +301,7 @@ class PlottingWidget(QWidget):
             self.axes.legend()
             self.axes.set_yscale('log')
             self.figure.tight_layout()
+            self._plot_state = state
             self.canvas.draw()
             
             return True, "\n".join(bin_values_log)
@@ -148,7 +314,15 @@ class PlottingWidget(QWidget):
     def save_plot(self, filename='phips_scattering.png'):
         """Save the plot to a file"""
         try:
-            self.figure.savefig(filename)
+            # Animated artists are left out of saved figures, so draw the GOAD line
+            # normally for the save
+            if self._goad_line is not None:
+                self._goad_line.set_animated(False)
+            try:
+                self.figure.savefig(filename)
+            finally:
+                if self._goad_line is not None:
+                    self._goad_line.set_animated(True)
             return True, f"Plot saved to {filename}"
         except Exception as e:
             return False, f"Error saving plot: {str(e)}"
\ No newline at end of file
@@ -1,9 +1,130 @@
-class SubprocessRunner:
+import os
+import shlex
+import codecs
+import selectors
+import subprocess
+from PyQt6.QtCore import QObject, QProcess, pyqtSignal
+
+class SubprocessRunner(QObject):
+    """Runs a command without blocking the event loop, streaming its output through signals"""
+
+    command_output = pyqtSignal(str, bool)  # Output text, is_error
+    command_finished = pyqtSignal(int)  # Exit code (-1 if the command could not be run)
+
+    def __init__(self, parent=None, merge_channels=False):
+        super().__init__(parent)
+        self.process = QProcess(self)
+        self.set_merge_channels(merge_channels)
+        self.process.readyReadStandardOutput.connect(self._handle_stdout)
+        self.process.readyReadStandardError.connect(self._handle_stderr)
+        self.process.finished.connect(self._process_finished)
+        self.process.errorOccurred.connect(self._process_error)
+
+        # Incremental decoders so multi-byte characters split across reads decode correctly
+        self._stdout_decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        self._stderr_decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+
+        self._argv_cache = (None, [])  # (command string, argv) of the last split
+
+    def set_merge_channels(self, merged):
+        """Send stderr through stdout for commands whose errors needn't be told apart
+
+        With merged channels all output is reported as normal output, in the order
+        it was written, and only one read signal fires per chunk. Takes effect from
+        the next run_command.
+        """
+        mode = QProcess.ProcessChannelMode.MergedChannels if merged else QProcess.ProcessChannelMode.SeparateChannels
+        self.process.setProcessChannelMode(mode)
+
     def run_command(self, command):
-        import subprocess
-        
+        """Start a command given as an argument list or a command line string
+
+        Returns immediately; output arrives through command_output and the exit
+        code through command_finished. Returns False if the command was not started.
+        """
+        if self.process.state() != QProcess.ProcessState.NotRunning:
+            self.command_output.emit("A command is already running", True)
+            return False
+
+        # Run the program directly rather than through a shell
         try:
-            result = subprocess.run(command, shell=True, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            return result.stdout.decode('utf-8'), result.stderr.decode('utf-8')
-        except subprocess.CalledProcessError as e:
-            return e.stdout.decode('utf-8'), e.stderr.decode('utf-8')
\ No newline at end of file
+            argv = self._split(command)
+        except ValueError as e:
+            return self._reject(f"Invalid command: {e}")
+        if not argv:
+            return self._reject("No command to run")
+
+        self._stdout_decoder.reset()
+        self._stderr_decoder.reset()
+        self.process.setProgram(argv[0])
+        self.process.setArguments(argv[1:])
+        self.process.start()
+        return True
+
+    def stream_command(self, command):
+        """Run a command without Qt, yielding (text, is_error) chunks as output arrives
+
+        Meant for callers outside the event loop (scripts, tests). stdout and stderr
+        are read together so neither pipe can fill up and stall the child. The
+        generator's return value is the exit code; a missing program raises
+        FileNotFoundError.
+        """
+        argv = self._split(command)
+        with subprocess.Popen(argv, stdout=subprocess.PIPE, stderr=subprocess.PIPE) as proc:
+            decoders = {
+                proc.stdout: (codecs.getincrementaldecoder('utf-8')(errors='replace'), False),
+                proc.stderr: (codecs.getincrementaldecoder('utf-8')(errors='replace'), True),
+            }
+            with selectors.DefaultSelector() as selector:
+                for pipe in decoders:
+                    selector.register(pipe, selectors.EVENT_READ)
+                while selector.get_map():
+                    for key, _ in selector.select():
+                        data = os.read(key.fd, 65536)
+                        if not data:
+                            selector.unregister(key.fileobj)
+                        decoder, is_error = decoders[key.fileobj]
+                        text = decoder.decode(data, final=not data)
+                        if text:
+                            yield text, is_error
+            return proc.wait()
+
+    def _split(self, command):
+        """Return a command's argument list, reusing the last split for a repeated string"""
+        if not isinstance(command, str):
+            return list(command)
+        if self._argv_cache[0] != command:
+            self._argv_cache = (command, shlex.split(command))
+        return list(self._argv_cache[1])
+
+    def _reject(self, message):
+        """Report a command that could not be run"""
+        self.command_output.emit(message, True)
+        self.command_finished.emit(-1)
+        return False
+
+    def _handle_stdout(self, final=False):
+        # Each read only decodes the new bytes; an incomplete character at the end
+        # is held back until the rest arrives
+        data = self._stdout_decoder.decode(self.process.readAllStandardOutput(), final)
+        if data:
+            self.command_output.emit(data, False)
+
+    def _handle_stderr(self, final=False):
+        data = self._stderr_decoder.decode(self.process.readAllStandardError(), final)
+        if data:
+            self.command_output.emit(data, True)
+
+    def _process_finished(self, exit_code, exit_status):
+        # Pass on anything still buffered before reporting completion
+        self._handle_stdout(final=True)
+        self._handle_stderr(final=True)
+        if exit_status == QProcess.ExitStatus.CrashExit:
+            exit_code = -1
+        self.command_finished.emit(exit_code)
+
+    def _process_error(self, error):
+        # A process that never started won't emit finished, so report it here
+        if error == QProcess.ProcessError.FailedToStart:
+            self.command_output.emit(f"Failed to start {self.process.program()}: {self.process.errorString()}", True)
+            self.command_finished.emit(-1)
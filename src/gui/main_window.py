@@ -1,4 +1,5 @@
-from PyQt6.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QWidget, QLineEdit, QPushButton
+from PyQt6.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QWidget, QLineEdit, QPushButton, QPlainTextEdit
+from PyQt6.QtGui import QColor, QTextCharFormat, QTextCursor
 import sys
 from core.subprocess_runner import SubprocessRunner
 
@@ -6,7 +7,7 @@ class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Light Scattering App")
-        self.setGeometry(100, 100, 400, 200)
+        self.setGeometry(100, 100, 600, 400)
 
         self.central_widget = QWidget()
         self.setCentralWidget(self.central_widget)
@@ -22,12 +23,34 @@ class MainWindow(QMainWindow):
         self.run_button.clicked.connect(self.run_command)
         self.layout.addWidget(self.run_button)
 
-        self.subprocess_runner = SubprocessRunner()
+        # Output is shown in the window rather than printed, so a slow terminal
+        # can't hold up the GUI thread
+        self.output_view = QPlainTextEdit(self)
+        self.output_view.setReadOnly(True)
+        self.layout.addWidget(self.output_view)
+        self._output_format = QTextCharFormat()
+        self._error_format = QTextCharFormat()
+        self._error_format.setForeground(QColor("#FF5555"))
+
+        self.subprocess_runner = SubprocessRunner(self)
+        self.subprocess_runner.command_output.connect(self.show_output)
+        self.subprocess_runner.command_finished.connect(self.command_finished)
 
     def run_command(self):
         command = self.command_input.text()
-        output = self.subprocess_runner.run_command(command)
-        print(output)  # For now, we just print the output to the console
+        self.output_view.clear()
+        if self.subprocess_runner.run_command(command):
+            self.run_button.setEnabled(False)
+
+    def show_output(self, text, is_error):
+        # Chunks aren't whole lines, so add them to the end as they arrive
+        cursor = QTextCursor(self.output_view.document())
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.insertText(text, self._error_format if is_error else self._output_format)
+        self.output_view.moveCursor(QTextCursor.MoveOperation.End)
+
+    def command_finished(self, exit_code):
+        self.run_button.setEnabled(True)
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
@@ -1,12 +1,12 @@
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QWidget, 
-                          QPushButton, QMessageBox, QLabel, QTextEdit, QHBoxLayout,
+                          QPushButton, QMessageBox, QLabel, QPlainTextEdit, QHBoxLayout,
                           QTabWidget, QFileDialog, QSplitter)
-from PyQt6.QtCore import Qt, QProcess, pyqtSignal, QTimer
+from PyQt6.QtCore import Qt, QProcess, pyqtSignal, QTimer, QFileSystemWatcher
+from PyQt6.QtGui import QColor, QTextCharFormat, QTextCursor
 import sys
 import os
 import json
 from components.command_manager import CommandManager
-from components.plotting import PlottingWidget
 from components.obj_viewer import MultiViewOBJViewer
 
 # Path for storing settings
@@ -16,8 +16,12 @@ DEFAULT_OUTPUT_DIR = "goad_run"  # Default directory where mueller_scatgrid is w
 # Add this line to track the rotated.obj file path
 OBJ_FILE = "rotated.obj"
 
-class TerminalLogger(QTextEdit):
+class TerminalLogger(QPlainTextEdit):
     """A terminal-style logger widget that displays command output"""
+    
+    # Oldest lines are dropped beyond this many, so long runs don't grow the document forever
+    MAX_LINES = 8000
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setReadOnly(True)
@@ -28,15 +32,30 @@ class TerminalLogger(QTextEdit):
             font-size: 11px;
         """)
         self.setPlaceholderText("Command output will appear here...")
+        self.setMaximumBlockCount(self.MAX_LINES)
+        
+        # Plain text uses the widget's colors; errors are drawn in red
+        self._output_format = QTextCharFormat()
+        self._error_format = QTextCharFormat()
+        self._error_format.setForeground(QColor("#FF5555"))
 
     def append_output(self, text, error=False):
         """Append output text to the terminal with optional error styling"""
-        if error:
-            self.append(f'<span style="color: #FF5555;">{text}</span>')
-        else:
-            self.append(text)
-        # Auto-scroll to the bottom
-        self.verticalScrollBar().setValue(self.verticalScrollBar().maximum())
+        # Only follow the output if the view is already at the bottom, so scrolling
+        # back through earlier output isn't interrupted
+        scrollbar = self.verticalScrollBar()
+        follow = scrollbar.value() >= scrollbar.maximum() - 1
+        
+        # Like QTextEdit.append, each call starts a new line
+        cursor = QTextCursor(self.document())
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        if not self.document().isEmpty():
+            cursor.insertBlock()
+        cursor.insertText(text, self._error_format if error else self._output_format)
+        
+        # Moving the cursor to the end scrolls just enough to show it
+        if follow:
+            self.moveCursor(QTextCursor.MoveOperation.End)
 
     def clear_output(self):
         """Clear the terminal output"""
@@ -60,10 +79,38 @@ class MainWindow(QMainWindow):
         self.cmd_manager.command_started.connect(self.on_command_started)
         self.cmd_manager.command_output.connect(self.on_command_output)
         self.cmd_manager.command_finished.connect(self.on_command_finished)
+        
+        # Command output is buffered and written to the terminal at most ~30 times
+        # a second, so chatty commands don't update the document per chunk
+        self._out_buf = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(33)
+        self._flush_timer.timeout.connect(self._flush_terminal)
+        
+        # Whether the output files exist, kept up to date by watching their
+        # directories instead of checking the filesystem on every use
+        self._has_mueller = False
+        self._has_obj = False
+        self._fs_watch = QFileSystemWatcher(self)
+        self._fs_watch.directoryChanged.connect(self._refresh_output_state)
+        
+        # File dialogs are created on first use and then reused, which also keeps
+        # the last directory and selection between opens
+        self._open_obj_dialog = None
+        self._save_plot_dialog = None
+        
+        # (path, mtime_ns, size) of the OBJ file shown in the viewer, so finished
+        # commands that didn't rewrite it don't parse and upload it again
+        self._loaded_obj_key = None
 
         self.init_ui()
+        self._refresh_output_state()
 
     def init_ui(self):
+        # Don't repaint while the widget tree is being built; layout is done once at the end
+        self.setUpdatesEnabled(False)
+        
         # Create main layout as a horizontal layout to split the screen
         main_layout = QHBoxLayout()
         
@@ -117,9 +164,10 @@ class MainWindow(QMainWindow):
         self.plot_tab = QWidget()
         plot_layout = QVBoxLayout()
         
-        # Create plotting widget
-        self.plotting = PlottingWidget(self)
-        plot_layout.addWidget(self.plotting)
+        # The plotting widget pulls in matplotlib, so it is created by
+        # _ensure_plotting the first time the plot tab is needed
+        self.plotting = None
+        self._plot_layout = plot_layout
         
         # Add save plot button
         save_plot_layout = QHBoxLayout()
@@ -134,6 +182,7 @@ class MainWindow(QMainWindow):
         # Add tabs to widget - only terminal and plot now
         self.tabs.addTab(self.terminal_tab, "Terminal Output")
         self.tabs.addTab(self.plot_tab, "Scatter Plot")
+        self.tabs.currentChanged.connect(self._on_tab_changed)
         
         left_pane.addWidget(self.tabs)
 
@@ -160,7 +209,7 @@ class MainWindow(QMainWindow):
         # View model button (now directly in the controls)
         self.view_3d_button = QPushButton("View Current Model", self)
         self.view_3d_button.clicked.connect(self.view_3d_model)
-        self.view_3d_button.setEnabled(os.path.exists(self.obj_file))
+        self.view_3d_button.setEnabled(False)  # Set by _refresh_output_state
         controls_layout.addWidget(self.view_3d_button)
         
         right_pane.addLayout(controls_layout)
@@ -199,28 +248,70 @@ class MainWindow(QMainWindow):
         # Create the main container and set it as the central widget
         container = QWidget()
         container.setLayout(main_layout)
+        main_layout.activate()
+        self.setUpdatesEnabled(True)
         self.setCentralWidget(container)
         
+    def _ensure_plotting(self):
+        """Create the plotting widget on first use"""
+        if self.plotting is None:
+            from components.plotting import PlottingWidget
+            self.plotting = PlottingWidget(self)
+            self._plot_layout.insertWidget(0, self.plotting)
+        return self.plotting
+    
+    def _on_tab_changed(self, index):
+        if self.tabs.widget(index) is self.plot_tab:
+            self._ensure_plotting()
+    
+    def _refresh_output_state(self, _path=None):
+        """Re-check which output files exist and watch the directories they live in"""
+        self._has_mueller = os.path.exists(self.mueller_file)
+        self._has_obj = os.path.exists(self.obj_file)
+        self.view_3d_button.setEnabled(self._has_obj)
+        
+        # Also watch the current directory so output directories created later are noticed
+        dirs = {os.path.dirname(self.mueller_file) or '.', os.path.dirname(self.obj_file) or '.', '.'}
+        new_dirs = [d for d in dirs if os.path.isdir(d) and d not in self._fs_watch.directories()]
+        if new_dirs:
+            self._fs_watch.addPaths(new_dirs)
+    
     def on_command_started(self, command):
         """Handle command started event"""
+        self._flush_timer.stop()
+        self._out_buf.clear()
         self.terminal.clear_output()
         self.terminal.append_output(f"> {command}")
         self.terminal.append_output("Running command...\n")
         
     def on_command_output(self, text, is_error):
         """Handle command output event"""
-        self.terminal.append_output(text, is_error)
+        self._out_buf.append((text, is_error))
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+    
+    def _flush_terminal(self):
+        """Write buffered output to the terminal, one append per run of same-styled text"""
+        self._flush_timer.stop()
+        buf, self._out_buf = self._out_buf, []
+        start = 0
+        for i in range(1, len(buf) + 1):
+            if i == len(buf) or buf[i][1] != buf[start][1]:
+                self.terminal.append_output("".join(text for text, _ in buf[start:i]), buf[start][1])
+                start = i
         
     def on_command_finished(self, exit_code):
         """Handle command finished event"""
+        # Show the remaining output before the completion messages
+        self._flush_terminal()
         if exit_code == 0:
             self.terminal.append_output("\nCommand completed successfully.", False)
             
-            # Check if output files exist
-            has_mueller = os.path.exists(self.mueller_file)
-            has_obj = os.path.exists(self.obj_file)
+            # Check if output files exist; the watcher's notification for files the
+            # command just wrote may not have arrived yet, so refresh once here
+            self._refresh_output_state()
             
-            if has_mueller:
+            if self._has_mueller:
                 self.terminal.append_output(f"Found output file: {self.mueller_file}", False)
                 self.plot_button.setEnabled(True)
                 
@@ -233,7 +324,7 @@ class MainWindow(QMainWindow):
                 self.plot_button.setEnabled(False)
             
             # Check for 3D model file
-            if has_obj:
+            if self._has_obj:
                 self.terminal.append_output(f"Found 3D model file: {self.obj_file}", False)
                 self.view_3d_button.setEnabled(True)
                 
@@ -259,7 +350,7 @@ class MainWindow(QMainWindow):
         self.tabs.setCurrentIndex(1)
         
         # Process and plot the data
-        success, message = self.plotting.process_and_plot_data(self.mueller_file, self.bins_file)
+        success, message = self._ensure_plotting().process_and_plot_data(self.mueller_file, self.bins_file)
         
         if success:
             self.terminal.append_output("Plot generated successfully.")
@@ -273,41 +364,65 @@ class MainWindow(QMainWindow):
         # No need to switch tabs as the model viewer is always visible
         
         # Load the model if it exists
-        if os.path.exists(self.obj_file):
+        if self._has_obj:
+            key = self._obj_file_key(self.obj_file)
+            if key is not None and key == self._loaded_obj_key:
+                self.terminal.append_output(f"3D model unchanged: {self.obj_file}")
+                return
+            
             success, message = self.obj_viewer.load_obj(self.obj_file)
             if success:
+                self._loaded_obj_key = key
                 self.terminal.append_output(f"3D model loaded successfully: {message}")
             else:
                 self.terminal.append_output(f"Error loading 3D model: {message}", True)
         else:
             self.terminal.append_output(f"3D model file not found: {self.obj_file}", True)
     
+    def _obj_file_key(self, path):
+        """Identify the current contents of an OBJ file, or None if it can't be read"""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (path, st.st_mtime_ns, st.st_size)
+    
+    def _run_file_dialog(self, dialog):
+        """Show a reusable file dialog and return the chosen path, or "" if cancelled"""
+        if dialog.exec():
+            files = dialog.selectedFiles()
+            if files:
+                return files[0]
+        return ""
+    
     def load_obj_file(self):
         """Open a file dialog to load an OBJ file"""
-        file_dialog = QFileDialog()
-        file_path, _ = file_dialog.getOpenFileName(
-            self, "Load OBJ File", "", "OBJ Files (*.obj);;All Files (*)"
-        )
+        if self._open_obj_dialog is None:
+            self._open_obj_dialog = QFileDialog(self, "Load OBJ File", "", "OBJ Files (*.obj);;All Files (*)")
+            self._open_obj_dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
+        file_path = self._run_file_dialog(self._open_obj_dialog)
         
         if file_path:
+            key = self._obj_file_key(file_path)
             success, message = self.obj_viewer.load_obj(file_path)
             if success:
+                self._loaded_obj_key = key
                 self.terminal.append_output(f"3D model loaded from {file_path}: {message}")
                 # Update the current obj file path
                 self.obj_file = file_path
-                self.view_3d_button.setEnabled(True)
+                self._refresh_output_state()
             else:
                 self.terminal.append_output(f"Error loading 3D model: {message}", True)
     
     def save_plot(self):
         """Save the plot to a file"""
-        file_dialog = QFileDialog()
-        file_path, _ = file_dialog.getSaveFileName(
-            self, "Save Plot", "", "PNG Files (*.png);;All Files (*)"
-        )
+        if self._save_plot_dialog is None:
+            self._save_plot_dialog = QFileDialog(self, "Save Plot", "", "PNG Files (*.png);;All Files (*)")
+            self._save_plot_dialog.setAcceptMode(QFileDialog.AcceptMode.AcceptSave)
+        file_path = self._run_file_dialog(self._save_plot_dialog)
         
         if file_path:
-            success, message = self.plotting.save_plot(file_path)
+            success, message = self._ensure_plotting().save_plot(file_path)
             if success:
                 self.terminal.append_output(message)
             else:
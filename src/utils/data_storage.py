@@ -1,7 +1,22 @@
+import mmap
+from pathlib import Path
+
 def save_data(data, filename):
-    with open(filename, 'w') as file:
-        file.write(data)
+    """Write bytes, or a str encoded as UTF-8, to filename"""
+    Path(filename).write_bytes(data if isinstance(data, (bytes, bytearray, memoryview)) else data.encode('utf-8'))
 
 def load_data(filename):
-    with open(filename, 'r') as file:
-        return file.read()
\ No newline at end of file
+    """Return the contents of filename as a read-only buffer backed by a memory map
+
+    The buffer can be handed to np.frombuffer, sliced, or passed to bytes()
+    without first copying the whole file into memory. Use it in a with block,
+    which closes the map:
+
+        with load_data(filename) as data:
+            values = np.frombuffer(data, dtype=np.uint8)
+    """
+    with open(filename, 'rb') as file:
+        if file.seek(0, 2) == 0:
+            # Empty files can't be mapped; an empty read-only view behaves the same
+            return memoryview(b'')
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
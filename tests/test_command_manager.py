@@ -0,0 +1,107 @@
+import os
+import json
+import tempfile
+import unittest
+from unittest import mock
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QProcess
+from src.components.command_manager import CommandManager
+
+class TestCommandManagerSettings(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.settings_file = os.path.join(self.tmpdir.name, "settings.json")
+        with open(self.settings_file, 'w') as f:
+            json.dump({'default_command': 'goad --help', 'alpha_value': 12.0}, f)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_settings_loaded_lazily(self):
+        manager = CommandManager(self.settings_file)
+        self.assertEqual(manager.default_command, manager.factory_default_command)
+        manager._ensure_settings_loaded()
+        self.assertEqual(manager.default_command, 'goad --help')
+
+    def test_load_settings(self):
+        manager = CommandManager(self.settings_file)
+        manager.load_settings()
+        self.assertEqual(manager.default_command, 'goad --help')
+        self.assertEqual(manager.alpha_value, 12.0)
+
+    def test_load_settings_reparses_after_change(self):
+        manager = CommandManager(self.settings_file)
+        manager.load_settings()
+        with open(self.settings_file, 'w') as f:
+            json.dump({'default_command': 'goad --version'}, f)
+        os.utime(self.settings_file, ns=(0, 0))
+        manager.load_settings()
+        self.assertEqual(manager.default_command, 'goad --version')
+
+    def test_save_settings_skips_unchanged_write(self):
+        manager = CommandManager(self.settings_file)
+        manager.load_settings()
+        manager.default_command = 'goad --version'
+        self.assertTrue(manager._save_settings())
+        os.utime(self.settings_file, ns=(1, 1))
+        manager._settings_mtime = manager._settings_file_mtime()
+        self.assertTrue(manager._save_settings())
+        self.assertEqual(os.stat(self.settings_file).st_mtime_ns, 1)
+
+    def test_output_forwarded_when_requested(self):
+        with mock.patch.dict(os.environ, {'GOAD_FORWARD_IO': '1'}):
+            manager = CommandManager(self.settings_file)
+        self.assertEqual(manager.process.processChannelMode(), QProcess.ProcessChannelMode.ForwardedChannels)
+        with mock.patch.dict(os.environ):
+            os.environ.pop('GOAD_FORWARD_IO', None)
+            manager = CommandManager(self.settings_file)
+        self.assertEqual(manager.process.processChannelMode(), QProcess.ProcessChannelMode.MergedChannels)
+
+class TestCommandManagerRun(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.manager = CommandManager(os.path.join(self.tmpdir.name, "settings.json"))
+        self.command_widget, self.button_layout = self.manager.create_ui()
+        self.manager.process.start = lambda: None  # Don't launch anything
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_split_command_handles_quoted_paths(self):
+        parts = self.manager._split_command('"/path with spaces/goad" --geo plate.obj')
+        self.assertEqual(parts, ["/path with spaces/goad", "--geo", "plate.obj"])
+
+    def test_split_command_reuses_tokens(self):
+        first = self.manager._split_command("goad --geo plate.obj")
+        first.append("--extra")
+        self.assertEqual(self.manager._split_command("goad --geo plate.obj"), ["goad", "--geo", "plate.obj"])
+
+    def test_run_command_replaces_discrete_angles(self):
+        self.manager.input.setText("goad --discrete 0,20,17 --geo plate.obj")
+        self.manager.discrete_checkbox.setChecked(True)
+        self.manager.alpha_input.setValue(117.0)
+        self.manager.beta_input.setValue(12.0)
+        self.manager.gamma_input.setValue(17.0)
+        self.manager.run_command()
+        self.assertEqual(self.manager.process.program(), "goad")
+        self.assertEqual(self.manager.process.arguments(),
+                         ["--discrete=117.0,12.0,17.0", "--geo", "plate.obj"])
+
+    def test_run_command_appends_discrete_angles(self):
+        self.manager.input.setText("goad --geo plate.obj")
+        self.manager.discrete_checkbox.setChecked(True)
+        self.manager.run_command()
+        self.assertEqual(self.manager.process.arguments(),
+                         ["--geo", "plate.obj", "--discrete=0.0,0.0,0.0"])
+
+if __name__ == '__main__':
+    unittest.main()
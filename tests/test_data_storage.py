@@ -0,0 +1,39 @@
+import os
+import tempfile
+import unittest
+from src.utils.data_storage import save_data, load_data
+
+class TestDataStorage(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmpdir.name, "data.txt")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_round_trip_text(self):
+        save_data("18.3 348.8 3404.5\n", self.filename)
+        with load_data(self.filename) as data:
+            self.assertEqual(data[:], b"18.3 348.8 3404.5\n")
+
+    def test_round_trip_bytes(self):
+        save_data(b"\x00\x01\x02", self.filename)
+        with load_data(self.filename) as data:
+            self.assertEqual(data[:], b"\x00\x01\x02")
+
+    def test_empty_file(self):
+        save_data("", self.filename)
+        with load_data(self.filename) as data:
+            self.assertEqual(len(data), 0)
+            self.assertEqual(bytes(data), b"")
+            self.assertEqual(bytes(data[:]), b"")
+
+    def test_buffer_protocol(self):
+        for content in ["", "abc"]:
+            with self.subTest(content=content):
+                save_data(content, self.filename)
+                with load_data(self.filename) as data:
+                    self.assertEqual(bytes(memoryview(data)), content.encode())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PyQt6.QtWidgets import QApplication
+from src.components.obj_viewer import OBJModel, MultiViewOBJViewer, _fan_triangles, _rotation_matrix
+
+QUAD_AND_HEXAGON = """# test mesh
+v 0 0 0
+v 1 0 0
+v 1 1 0
+v 0 1 0
+v 2 0 0
+v 3 0 0
+vn 0 0 1
+f 1//1 2//1 3//1 4//1
+f 1 2 3 4 5 6
+"""
+
+class TestFanTriangles(unittest.TestCase):
+    def test_fan_triangles(self):
+        corners, tri_face = _fan_triangles(np.array([3, 5, 4]))
+        np.testing.assert_array_equal(corners, [[0, 1, 2],
+                                                [3, 4, 5], [3, 5, 6], [3, 6, 7],
+                                                [8, 9, 10], [8, 10, 11]])
+        np.testing.assert_array_equal(tri_face, [0, 1, 1, 1, 2, 2])
+
+    def test_degenerate_faces_give_no_triangles(self):
+        corners, tri_face = _fan_triangles(np.array([2, 3]))
+        np.testing.assert_array_equal(corners, [[2, 3, 4]])
+        np.testing.assert_array_equal(tri_face, [1])
+
+class TestRotationMatrix(unittest.TestCase):
+    def test_right_handed_rotations(self):
+        # +90 degrees about each axis maps the next axis onto the one after, as glRotatef
+        np.testing.assert_allclose(_rotation_matrix(90, 0) @ [0, 1, 0, 1], [0, 0, 1, 1], atol=1e-12)
+        np.testing.assert_allclose(_rotation_matrix(90, 1) @ [0, 0, 1, 1], [1, 0, 0, 1], atol=1e-12)
+        np.testing.assert_allclose(_rotation_matrix(90, 2) @ [1, 0, 0, 1], [0, 1, 0, 1], atol=1e-12)
+
+class TestOBJModel(unittest.TestCase):
+    def load(self, text):
+        fd, path = tempfile.mkstemp(suffix=".obj")
+        with os.fdopen(fd, 'w') as f:
+            f.write(text)
+        self.addCleanup(os.remove, path)
+        model = OBJModel()
+        self.assertTrue(model.load(path))
+        return model
+
+    def test_fan_triangulation(self):
+        model = self.load(QUAD_AND_HEXAGON)
+        np.testing.assert_array_equal(model.face_sizes, [4, 6])
+        np.testing.assert_array_equal(model.tri_vidx, [[0, 1, 2], [0, 2, 3],
+                                                       [0, 1, 2], [0, 2, 3], [0, 3, 4], [0, 4, 5]])
+        np.testing.assert_array_equal(model.tri_nidx[:2], [[0, 0, 0], [0, 0, 0]])
+        np.testing.assert_array_equal(model.tri_nidx[2:], -1)
+
+    def test_all_triangles(self):
+        model = self.load("v 0 0 0\nv 1 0 0\nv 1 1 0\nv 0 1 0\nf 1 2 3\nf 1 3 4\n")
+        np.testing.assert_array_equal(model.triangle_indices, [[0, 1, 2], [3, 4, 5]])
+        np.testing.assert_array_equal(model.tri_vidx, [[0, 1, 2], [0, 2, 3]])
+        np.testing.assert_array_equal(model.tri_face, [0, 1])
+
+    def test_draw_arrays(self):
+        model = self.load(QUAD_AND_HEXAGON)
+        self.assertEqual(model.draw_positions.dtype, np.float32)
+        self.assertEqual(len(model.draw_indices), 3 * 6)
+        np.testing.assert_array_equal(model.draw_positions[model.draw_indices[:3]],
+                                      [[0, 0, 0], [1, 0, 0], [1, 1, 0]])
+        np.testing.assert_array_equal(model.draw_normals[model.draw_indices[:6]], [[0, 0, 1]] * 6)
+
+    def test_shared_corners_are_deduplicated(self):
+        model = self.load(QUAD_AND_HEXAGON)
+        # 4 quad corners with the file normal + 6 hexagon corners with the face normal
+        self.assertEqual(len(model.draw_positions), 10)
+        self.assertEqual(len(model.draw_normals), 10)
+
+    def test_face_normal_used_when_missing(self):
+        model = self.load("v 0 0 0\nv 0 1 0\nv 0 0 1\nf 1 2 3\n")
+        np.testing.assert_allclose(model.draw_normals, [[1, 0, 0]] * 3)
+
+    def test_invalid_vertex_indices_are_dropped(self):
+        model = self.load("v 0 0 0\nv 1 0 0\nv 1 1 0\nf 1 2 3\nf 1 2 9\n")
+        np.testing.assert_array_equal(model.tri_vidx, [[0, 1, 2]])
+
+    def test_invalid_normal_indices_become_missing(self):
+        model = self.load("v 0 0 0\nv 0 1 0\nv 0 0 1\nvn 0 0 1\nf 1//1 2//5 3//-3\n")
+        np.testing.assert_array_equal(model.tri_nidx, [[0, -1, -1]])
+
+    def test_face_formats(self):
+        header = "v 0 0 0 1.0\nv 1 0 0 1.0\nv 1 1 0 1.0\nvt 0 0\nvn 0 0 1\nvn 0 1 0\n"
+        for face, normals in [("f 1 2 3", [-1, -1, -1]),
+                              ("f 1/1 2/1 3/1", [-1, -1, -1]),
+                              ("f 1//1 2//2 3//1", [0, 1, 0]),
+                              ("f 1/1/2 2/1/1 3/1/2", [1, 0, 1]),
+                              ("f 1//2 2/1 3/1/1", [1, -1, 0])]:
+            with self.subTest(face=face):
+                model = self.load(header + face + "\n")
+                np.testing.assert_array_equal(model.vertices[:, 0], [0, 1, 1])
+                np.testing.assert_array_equal(model.tri_vidx, [[0, 1, 2]])
+                np.testing.assert_array_equal(model.tri_nidx, [normals])
+
+    def test_trailing_comments(self):
+        model = self.load("v 0 0 0 # origin\nv 1 0 0\nv 1 1 0 1.0 # with w\nvn 0 0 1 # up\nf 1//1 2//1 3//1\n")
+        np.testing.assert_array_equal(model.vertices, [[0, 0, 0], [1, 0, 0], [1, 1, 0]])
+        np.testing.assert_array_equal(model.normals, [[0, 0, 1]])
+        np.testing.assert_array_equal(model.tri_vidx, [[0, 1, 2]])
+
+    def test_indented_lines(self):
+        model = self.load("v 9 9 9\n  v 0 0 0\n\tv 1 0 0\n v 1 1 0\n  vn 0 0 1\n  f 2//1 3//1 4//1\n")
+        self.assertEqual(len(model.vertices), 4)
+        np.testing.assert_array_equal(model.normals, [[0, 0, 1]])
+        np.testing.assert_array_equal(model.tri_vidx, [[1, 2, 3]])
+        np.testing.assert_array_equal(model.vertices[model.tri_vidx[0]], [[0, 0, 0], [1, 0, 0], [1, 1, 0]])
+
+    def test_missing_file(self):
+        self.assertFalse(OBJModel().load("does_not_exist.obj"))
+
+class TestMultiViewOBJViewer(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def test_model_shared_between_views(self):
+        fd, path = tempfile.mkstemp(suffix=".obj")
+        with os.fdopen(fd, 'w') as f:
+            f.write(QUAD_AND_HEXAGON)
+        self.addCleanup(os.remove, path)
+        viewer = MultiViewOBJViewer()
+        success, _ = viewer.load_obj(path)
+        self.assertTrue(success)
+        self.assertIs(viewer.top_viewer.obj_model, viewer.bottom_viewer.obj_model)
+        self.assertEqual(viewer.top_viewer.model_size, 3.0)
+        self.assertEqual(viewer.bottom_viewer.model_size, 3.0)
+
+    def test_missing_file(self):
+        success, message = MultiViewOBJViewer().load_obj("does_not_exist.obj")
+        self.assertFalse(success)
+        self.assertIn("does_not_exist.obj", message)
+
+if __name__ == '__main__':
+    unittest.main()
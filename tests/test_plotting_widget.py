@@ -0,0 +1,224 @@
+import io
+import os
+import tempfile
+import contextlib
+import unittest
+from unittest import mock
+import numpy as np
+import matplotlib.image
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PyQt6.QtWidgets import QApplication
+from src.components import plotting
+from src.components.plotting import PlottingWidget, _bin_means
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+def reference_bin_means(angles, values, centers, width):
+    """The original per-bin np.where loop that _bin_means replaces"""
+    means = np.zeros(len(centers))
+    counts = np.zeros(len(centers), dtype=int)
+    for i, center in enumerate(centers):
+        indices = np.where((angles >= center - width / 2) & (angles < center + width / 2))[0]
+        counts[i] = len(indices)
+        if len(indices) > 0:
+            means[i] = np.mean(values[indices])
+    return means, counts
+
+class BinMeansTestCase(unittest.TestCase):
+    def assert_matches_reference(self, angles, values, centers, width):
+        means, counts = _bin_means(angles, values, centers, width)
+        ref_means, ref_counts = reference_bin_means(angles, values, centers, width)
+        np.testing.assert_array_equal(counts, ref_counts)
+        np.testing.assert_allclose(means, ref_means, rtol=1e-12, atol=0)
+
+class TestBinMeans(BinMeansTestCase):
+    def setUp(self):
+        self.rng = np.random.default_rng(1)
+        self.centers = np.linspace(18, 170, 20)
+
+    def test_sorted(self):
+        angles = np.sort(self.rng.uniform(0, 180, 1000))
+        self.assert_matches_reference(angles, self.rng.uniform(0, 10, 1000), self.centers, 8)
+
+    def test_unsorted(self):
+        angles = self.rng.uniform(0, 180, 1000)
+        self.assert_matches_reference(angles, self.rng.uniform(0, 10, 1000), self.centers, 8)
+
+    def test_repeated_angles(self):
+        # A scatgrid repeats each theta once per phi, in no particular order
+        angles = self.rng.permutation(np.repeat(np.arange(0, 181, 2.0), 5))
+        self.assert_matches_reference(angles, self.rng.uniform(0, 10, angles.size), self.centers, 8)
+
+    def test_empty_bins(self):
+        angles = np.array([18.0, 19.0, 99.0, 17.5])
+        values = np.array([1.0, 2.0, 3.0, 4.0])
+        means, counts = _bin_means(angles, values, self.centers, 4)
+        self.assertEqual(counts.sum(), 4)
+        self.assertTrue(np.all(means[counts == 0] == 0))
+        self.assert_matches_reference(angles, values, self.centers, 4)
+
+    def test_overlapping_bins(self):
+        # Bins wider than their spacing share points
+        angles = self.rng.uniform(0, 180, 1000)
+        self.assert_matches_reference(angles, self.rng.uniform(0, 10, 1000), self.centers, 20)
+
+    def test_bins_past_the_last_angle(self):
+        # The last bins end beyond the largest angle, so their upper index is len(values)
+        angles = np.array([10.0, 150.0, 166.5, 168.0])
+        values = np.array([1.0, 2.0, 3.0, 4.0])
+        means, counts = _bin_means(angles, values, self.centers, 8)
+        self.assertEqual(counts[-1], 2)
+        self.assertEqual(means[-1], 3.5)
+        self.assert_matches_reference(angles, values, self.centers, 8)
+        self.assert_matches_reference(angles[::-1].copy(), values[::-1].copy(), self.centers, 8)
+
+    def test_no_points(self):
+        means, counts = _bin_means(np.array([]), np.array([]), self.centers, 8)
+        np.testing.assert_array_equal(counts, 0)
+        np.testing.assert_array_equal(means, 0)
+
+class TestReadMuellerScatgrid(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.widget = PlottingWidget()
+        fd, self.path = tempfile.mkstemp()
+        os.close(fd)
+        self.addCleanup(os.remove, self.path)
+        self.write(np.arange(12.0).reshape(3, 4))
+
+    def write(self, array):
+        np.savetxt(self.path, array)
+
+    def read(self):
+        data, _ = self.widget.read_mueller_scatgrid(self.path, usecols=(0, 2))
+        return data
+
+    def test_selected_columns_read_only(self):
+        data = self.read()
+        self.assertEqual(data.ndim, 2)
+        np.testing.assert_array_equal(data, [[0, 2], [4, 6], [8, 10]])
+        self.assertFalse(data.flags.writeable)
+
+    def test_single_row_is_2d(self):
+        self.write(np.arange(4.0).reshape(1, 4))
+        self.assertEqual(self.read().shape, (1, 2))
+
+    def test_cached_until_file_changes(self):
+        first = self.read()
+        self.assertIs(self.read(), first)
+        
+        # A new modification time invalidates the cache even if the size is the same
+        st = os.stat(self.path)
+        os.utime(self.path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        second = self.read()
+        self.assertIsNot(second, first)
+        
+        # So does a new size, even if the modification time is put back
+        st = os.stat(self.path)
+        self.write(np.arange(16.0).reshape(4, 4))
+        os.utime(self.path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        third = self.read()
+        self.assertIsNot(third, second)
+        self.assertEqual(third.shape, (4, 2))
+
+    def test_missing_file(self):
+        data, message = self.widget.read_mueller_scatgrid("does_not_exist")
+        self.assertIsNone(data)
+        self.assertIn("does_not_exist", message)
+
+class TestSavePlot(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.widget = PlottingWidget()
+        self.widget.reference_data_file = os.path.join(self.tmpdir.name, "no_reference.txt")
+        data_file = os.path.join(self.tmpdir.name, "mueller_scatgrid")
+        angles = np.linspace(0, 180, 181)
+        np.savetxt(data_file, np.column_stack([angles, np.zeros_like(angles), 1 + angles, angles]))
+        success, message = self.widget.process_and_plot_data(data_file)
+        self.assertTrue(success, message)
+
+    def save(self, name):
+        path = os.path.join(self.tmpdir.name, name)
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr):
+            success, message = self.widget.save_plot(path)
+        self.assertTrue(success, message)
+        self.assertEqual(stderr.getvalue(), "")
+        return path
+
+    def test_vector_formats_include_goad_line(self):
+        for name in ["plot.svg", "plot.pdf"]:
+            with self.subTest(name=name):
+                self.assertGreater(os.path.getsize(self.save(name)), 0)
+        with open(os.path.join(self.tmpdir.name, "plot.svg")) as f:
+            self.assertIn("#0000ff", f.read())
+
+    def test_save_keeps_blit_background(self):
+        background = self.widget._background
+        self.assertIsNotNone(background)
+        path = self.save("plot.png")
+        self.assertIs(self.widget._background, background)
+        self.assertTrue(self.widget._goad_line.get_animated())
+        
+        # The saved image still has the (blue) GOAD line
+        image = matplotlib.image.imread(path)
+        blue = (image[..., 2] > 0.9) & (image[..., 0] < 0.1) & (image[..., 1] < 0.1)
+        self.assertTrue(blue.any())
+
+class TestBinMeansKernel(BinMeansTestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.angles = rng.uniform(0, 180, 500)
+        self.values = rng.uniform(0, 10, 500)
+        self.centers = np.linspace(18, 170, 20)
+        # Let small inputs reach the kernel, and load numba afresh for each test
+        for name, value in [('_BIN_KERNEL_MIN_POINTS', 0),
+                            ('_bin_accumulate', None), ('_bin_accumulate_loaded', False)]:
+            patcher = mock.patch.object(plotting, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    @unittest.skipIf(numba is None, "numba is not installed")
+    def test_unsorted_with_numba(self):
+        self.assert_matches_reference(self.angles, self.values, self.centers, 8)
+        self.assertIsNotNone(plotting._bin_accumulate)
+
+    def test_unsorted_without_numba(self):
+        with mock.patch.dict('sys.modules', {'numba': None}):
+            self.assert_matches_reference(self.angles, self.values, self.centers, 8)
+        self.assertIsNone(plotting._bin_accumulate)
+
+    def test_kernel_failure_falls_back_to_sorting(self):
+        failing = mock.Mock(side_effect=ImportError("No module named 'src'"))
+        plotting._bin_accumulate = failing
+        plotting._bin_accumulate_loaded = True
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            self.assert_matches_reference(self.angles, self.values, self.centers, 8)
+            self.assert_matches_reference(self.angles, self.values, self.centers, 8)
+        
+        # The kernel is only tried once, and the failure reported once
+        failing.assert_called_once()
+        self.assertIsNone(plotting._bin_accumulate)
+        self.assertTrue(plotting._bin_accumulate_loaded)
+        self.assertEqual(stdout.getvalue().count("No module named 'src'"), 1)
+
+    def test_small_input_skips_numba(self):
+        with mock.patch.object(plotting, '_BIN_KERNEL_MIN_POINTS', 1000), \
+             mock.patch.object(plotting, '_get_bin_accumulate') as get_kernel:
+            self.assert_matches_reference(self.angles, self.values, self.centers, 8)
+        get_kernel.assert_not_called()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,25 @@
+import os
+import re
+import unittest
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+# Old-style string based connections, e.g. connect(obj, SIGNAL("clicked()"), ...)
+STRING_CONNECT = re.compile(r'\b(SIGNAL|SLOT)\s*\(')
+
+class TestSignalConnections(unittest.TestCase):
+    def test_no_string_based_connections(self):
+        offenders = []
+        for root, _, files in os.walk(SRC_DIR):
+            for name in files:
+                if not name.endswith(".py"):
+                    continue
+                path = os.path.join(root, name)
+                with open(path, 'r', encoding='utf-8') as f:
+                    for lineno, line in enumerate(f, 1):
+                        if STRING_CONNECT.search(line):
+                            offenders.append(f"{os.path.relpath(path, SRC_DIR)}:{lineno}")
+        self.assertEqual(offenders, [], "Use bound signal connections (signal.connect(slot)) instead of SIGNAL()/SLOT()")
+
+if __name__ == '__main__':
+    unittest.main()
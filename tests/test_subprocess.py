@@ -1,19 +1,81 @@
+import os
 import unittest
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PyQt6.QtCore import QCoreApplication
 from src.core.subprocess_runner import SubprocessRunner
 
 class TestSubprocessRunner(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QCoreApplication.instance() or QCoreApplication([])
+
     def setUp(self):
         self.runner = SubprocessRunner()
+        self.output = []
+        self.exit_codes = []
+        self.runner.command_output.connect(lambda text, is_error: self.output.append((text, is_error)))
+        self.runner.command_finished.connect(self.exit_codes.append)
+
+    def run_to_completion(self, command):
+        # waitForFinished delivers the process signals without an event loop
+        started = self.runner.run_command(command)
+        if started:
+            self.runner.process.waitForFinished(5000)
+        return started
 
     def test_run_command_success(self):
         command = ["echo", "Hello, World!"]
-        output = self.runner.run_command(command)
-        self.assertEqual(output.strip(), "Hello, World!")
+        self.assertTrue(self.run_to_completion(command))
+        self.assertEqual("".join(text for text, _ in self.output).strip(), "Hello, World!")
+        self.assertEqual(self.exit_codes, [0])
+
+    def test_run_command_string(self):
+        self.assertTrue(self.run_to_completion('echo "Hello, World!"'))
+        self.assertEqual("".join(text for text, _ in self.output).strip(), "Hello, World!")
+
+    def test_split_reuses_last_command(self):
+        first = self.runner._split('echo "a b"')
+        first.append("c")
+        self.assertEqual(self.runner._split('echo "a b"'), ["echo", "a b"])
+        self.assertEqual(self.runner._split(["echo", "x"]), ["echo", "x"])
+
+    def test_run_command_split_multibyte_output(self):
+        # "é" is written one byte at a time, so it arrives split across reads
+        self.assertTrue(self.run_to_completion(["sh", "-c", "printf '\\303'; sleep 0.1; printf '\\251\\n'"]))
+        self.assertEqual("".join(text for text, _ in self.output), "\u00e9\n")
+
+    def test_run_command_merged_channels(self):
+        self.runner.set_merge_channels(True)
+        self.assertTrue(self.run_to_completion(["sh", "-c", "echo out; echo err >&2"]))
+        self.assertEqual("".join(text for text, _ in self.output), "out\nerr\n")
+        self.assertFalse(any(is_error for _, is_error in self.output))
 
     def test_run_command_failure(self):
         command = ["non_existent_command"]
-        with self.assertRaises(Exception):
-            self.runner.run_command(command)
+        self.run_to_completion(command)
+        self.assertEqual(self.exit_codes, [-1])
+        self.assertTrue(self.output and self.output[-1][1])
+
+    def test_run_command_empty(self):
+        self.assertFalse(self.runner.run_command(""))
+        self.assertEqual(self.exit_codes, [-1])
+
+    def test_stream_command(self):
+        chunks = []
+        stream = self.runner.stream_command(["sh", "-c", "echo out; echo err >&2; exit 3"])
+        while True:
+            try:
+                chunks.append(next(stream))
+            except StopIteration as stop:
+                exit_code = stop.value
+                break
+        self.assertEqual("".join(text for text, is_error in chunks if not is_error), "out\n")
+        self.assertEqual("".join(text for text, is_error in chunks if is_error), "err\n")
+        self.assertEqual(exit_code, 3)
+
+    def test_stream_command_missing_program(self):
+        with self.assertRaises(FileNotFoundError):
+            list(self.runner.stream_command(["non_existent_command"]))
 
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()